@@ -36,6 +36,7 @@ import logging
 import os
 import sys
 import traceback
+from collections.abc import Sequence
 from typing import Any
 
 from common import create_flask_app, register_routes, register_websocket_handlers, run_server, start_status_monitor
@@ -428,7 +429,7 @@ class PlayerManager:
         """
         return self.process.get_all_statuses(self.config.list_players())
 
-    def get_mixer_controls(self, device: str) -> list[str]:
+    def get_mixer_controls(self, device: str) -> Sequence[str]:
         """
         Get available ALSA mixer controls for a device.
 
@@ -436,7 +437,7 @@ class PlayerManager:
             device: ALSA device identifier (e.g., 'hw:0,0').
 
         Returns:
-            List of control names.
+            Sequence of control names (read-only).
         """
         return self.audio.get_mixer_controls(device)
 
@@ -520,11 +520,14 @@ def safe_emit(socketio, event, data, timeout=WEBSOCKET_EMIT_TIMEOUT_SECS):
     try:
         socketio.emit(event, data)
 
-        # Reset failure count on success
-        with _websocket_failure_count_lock:
-            if _websocket_failure_count > 0:
-                logger.info(f"WebSocket emit recovered after {_websocket_failure_count} failures")
-                _websocket_failure_count = 0
+        # Reset failure count on success. Reading the int without the lock is
+        # safe under the GIL and keeps the common (no failures) path lock-free;
+        # the count is re-checked under the lock before resetting it.
+        if _websocket_failure_count > 0:
+            with _websocket_failure_count_lock:
+                if _websocket_failure_count > 0:
+                    logger.info(f"WebSocket emit recovered after {_websocket_failure_count} failures")
+                    _websocket_failure_count = 0
 
         return True
 
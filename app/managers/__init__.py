@@ -3,11 +3,25 @@ Manager classes for the multi-room audio player system.
 
 This package contains focused manager classes that handle specific
 responsibilities, extracted from the original monolithic SqueezeliteManager.
+
+Manager classes are loaded lazily (PEP 562) so that importing one manager
+does not pay the import cost of the others.
 """
 
-from .audio_manager import AudioManager
-from .config_manager import ConfigManager, ConfigValidationError
-from .process_manager import ProcessManager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .audio_manager import AudioManager
+    from .config_manager import ConfigManager, ConfigValidationError
+    from .process_manager import ProcessManager
+
+# Maps each exported name to the submodule that defines it
+_LAZY_IMPORTS = {
+    "AudioManager": ".audio_manager",
+    "ConfigManager": ".config_manager",
+    "ConfigValidationError": ".config_manager",
+    "ProcessManager": ".process_manager",
+}
 
 __all__ = [
     "AudioManager",
@@ -15,3 +29,35 @@ __all__ = [
     "ConfigValidationError",
     "ProcessManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import manager classes on first access.
+
+    The resolved attribute is cached in the module globals so subsequent
+    lookups bypass this function entirely.
+
+    Args:
+        name: Attribute name being looked up on the package.
+
+    Returns:
+        The requested manager class.
+
+    Raises:
+        AttributeError: If name is not an exported manager.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
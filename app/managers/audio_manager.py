@@ -2,13 +2,18 @@
 Audio Manager for device detection and volume control.
 
 Handles ALSA audio device enumeration, mixer control detection,
-and volume get/set operations via amixer. Also supports PortAudio
-devices for test tones via the sounddevice library.
+and volume get/set operations via pyalsaaudio (when installed) or
+amixer. Also supports PortAudio devices for test tones via the
+sounddevice library.
 """
 
+import functools
 import logging
+import os
 import re
-import subprocess
+import shutil
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
 
 # Optional imports for PortAudio test tone support
 try:
@@ -19,6 +24,18 @@ try:
 except ImportError:
     SOUNDDEVICE_AVAILABLE = False
 
+# Optional in-process ALSA mixer bindings (pyalsaaudio) for volume control.
+# Falls back to forking amixer when not installed.
+try:
+    import alsaaudio
+
+    ALSAAUDIO_AVAILABLE = True
+except ImportError:
+    ALSAAUDIO_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import subprocess
+
 logger = logging.getLogger(__name__)
 
 # Type alias for audio device info
@@ -28,33 +45,53 @@ AudioDevice = dict[str, str]
 # CONSTANTS
 # =============================================================================
 
-# Default fallback when no controls can be detected
-DEFAULT_MIXER_CONTROLS = ["Master", "PCM"]
+# Default fallback when no controls can be detected.
+# A tuple so it can be returned directly without a defensive copy.
+DEFAULT_MIXER_CONTROLS = ("Master", "PCM")
 
 # Controls to try when reading volume (includes Capture for status reporting)
-VOLUME_READ_CONTROLS = ["Master", "PCM", "Speaker", "Headphone", "Digital", "Capture"]
+VOLUME_READ_CONTROLS = ("Master", "PCM", "Speaker", "Headphone", "Digital", "Capture")
 
 # Controls to try when setting volume (excludes Capture - it's for input levels)
-VOLUME_WRITE_CONTROLS = ["Master", "PCM", "Speaker", "Headphone", "Digital"]
+VOLUME_WRITE_CONTROLS = ("Master", "PCM", "Speaker", "Headphone", "Digital")
 
-# Virtual/software devices that don't support hardware volume control
-VIRTUAL_AUDIO_DEVICES = ["null", "pulse", "dmix", "default"]
+# Virtual/software devices that don't support hardware volume control.
+# A frozenset since it is only used for membership checks.
+VIRTUAL_AUDIO_DEVICES = frozenset({"null", "pulse", "dmix", "default"})
 
 # Default volume percentage for virtual devices or when detection fails
 DEFAULT_VOLUME_PERCENT = 75
 
+# ALSA hardware device prefixes whose identifiers carry a card number.
+# Matches: "hw:0,0" -> "0", "hw:1,3" -> "1", "plughw:2,0" -> "2"
+ALSA_HARDWARE_DEVICE_PREFIXES = ("hw:", "plughw:")
+
+# Kernel-exported list of ALSA PCM devices (one line per card/device pair).
+# Reading this directly avoids forking `aplay -l`, which reads the same data.
+# Example line: "00-00: ALC887-VD Analog : ALC887-VD Analog : playback 1 : capture 1"
+ALSA_PROC_PCM_PATH = "/proc/asound/pcm"
+
+# Directory holding ALSA device nodes. udev/devtmpfs adds and removes nodes
+# here on hotplug, so its mtime changes whenever the set of cards changes.
+# (procfs mtimes are not updated on hotplug and cannot be used for this.)
+ALSA_DEVICE_DIR = "/dev/snd"
+
 # =============================================================================
 # REGEX PATTERNS FOR ALSA OUTPUT PARSING
 # =============================================================================
 # These patterns parse output from ALSA command-line tools (aplay, amixer).
 # They are designed to be resilient to minor formatting variations.
 
-# Extracts card number from ALSA hardware device identifiers.
-# Matches: "hw:0,0" -> "0", "hw:1,3" -> "1", "plughw:2,0" -> "2"
-# Format: "hw:" followed by one or more digits (card number),
-#         optionally followed by comma and device number.
-# Used by: get_mixer_controls(), get_volume(), set_volume()
-ALSA_CARD_NUMBER_PATTERN = re.compile(r"hw:([0-9]+)")
+# Extracts card number, card name, device number and device name from aplay -l.
+# Matches: "card 0: PCH [HDA Intel PCH], device 0: ALC887-VD Analog [ALC887-VD Analog]"
+#          -> ("0", "HDA Intel PCH", "0", "ALC887-VD Analog")
+# Format: One line per playback device; short names may contain spaces,
+#         long names are the bracketed text after each short name.
+# Used by: get_devices() (aplay fallback)
+ALSA_APLAY_DEVICE_PATTERN = re.compile(
+    r"^card (\d+): [^\[\n]*\[([^\]\n]*)\], device (\d+): [^\[\n]*\[([^\]\n]*)\]",
+    re.MULTILINE,
+)
 
 # Extracts mixer control name from amixer scontrols output.
 # Matches: "Simple mixer control 'Master',0" -> "Master"
@@ -72,6 +109,119 @@ ALSA_CONTROL_NAME_PATTERN = re.compile(r"'([^']+)'")
 ALSA_VOLUME_PERCENT_PATTERN = re.compile(r"\[(\d+)%\]")
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _parse_card_number(device: str) -> str | None:
+    """
+    Extract the card number from an ALSA hardware device identifier.
+
+    Uses plain string operations rather than a regex since this runs on
+    every volume read and write.
+
+    Args:
+        device: ALSA device identifier (e.g., 'hw:1,0', 'plughw:2,0').
+
+    Returns:
+        Card number string (e.g., '1'), or None if the device is not an
+        ALSA hardware device with a numeric card.
+    """
+    if not device.startswith(ALSA_HARDWARE_DEVICE_PREFIXES):
+        return None
+    card_num = device.partition(":")[2].partition(",")[0]
+    return card_num if card_num.isdigit() else None
+
+
+def _prioritize_control(controls: Sequence[str], preferred: str | None) -> Sequence[str]:
+    """
+    Order mixer controls so a previously working one is tried first.
+
+    Args:
+        controls: Control names in default trial order.
+        preferred: Control that last worked for this card, if any.
+
+    Returns:
+        Control names with preferred moved to the front.
+    """
+    if preferred is None or preferred == controls[0]:
+        return controls
+    return [preferred, *(c for c in controls if c != preferred)]
+
+
+@functools.cache
+def _resolve_binary(name: str) -> str:
+    """
+    Resolve an ALSA utility to its absolute path, caching the result.
+
+    Args:
+        name: Binary name (e.g., 'amixer').
+
+    Returns:
+        Absolute path if found in PATH, otherwise the bare name so that
+        running it raises FileNotFoundError as before.
+    """
+    return shutil.which(name) or name
+
+
+def _run_alsa_command(args: list[str]) -> "subprocess.CompletedProcess[str]":
+    """
+    Run an ALSA command-line tool and capture its text output.
+
+    CPython only launches children via posix_spawn (vfork semantics, no
+    page-table copy of this process) when the executable is given as a
+    path and close_fds is False. Python-created descriptors are
+    non-inheritable by default, so nothing extra leaks into amixer/aplay.
+
+    Args:
+        args: Command and arguments (e.g., ['amixer', '-c', '0', 'scontrols']).
+
+    Returns:
+        Completed process with decoded stdout/stderr.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero.
+        FileNotFoundError: If the command is not installed.
+    """
+    import subprocess
+
+    return subprocess.run(
+        [_resolve_binary(args[0]), *args[1:]],
+        capture_output=True,
+        text=True,
+        check=True,
+        close_fds=False,
+    )
+
+
+def _run_alsa_setter(args: list[str]) -> "subprocess.CompletedProcess[bytes]":
+    """
+    Run an ALSA command-line tool whose output is only needed on failure.
+
+    Like _run_alsa_command, but stdout is discarded, stderr is kept as raw
+    bytes, and a non-zero exit is reported through returncode instead of
+    raising CalledProcessError.
+
+    Args:
+        args: Command and arguments (e.g., ['amixer', '-c', '0', 'sset', 'Master', '50%']).
+
+    Returns:
+        Completed process with returncode and undecoded stderr.
+
+    Raises:
+        FileNotFoundError: If the command is not installed.
+    """
+    import subprocess
+
+    return subprocess.run(
+        [_resolve_binary(args[0]), *args[1:]],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
+
+
 class AudioManager:
     """
     Manages audio device detection and volume control.
@@ -84,6 +234,8 @@ class AudioManager:
         windows_mode: Whether running in Windows compatibility mode.
     """
 
+    __slots__ = ("windows_mode", "_mixers", "_read_controls", "_write_controls", "_devices_cache")
+
     def __init__(self, windows_mode: bool = False) -> None:
         """
         Initialize the AudioManager.
@@ -93,6 +245,13 @@ class AudioManager:
                          querying ALSA (for development on Windows).
         """
         self.windows_mode = windows_mode
+        # pyalsaaudio Mixer objects keyed by (card number, control name)
+        self._mixers: dict[tuple[str, str], Any] = {}
+        # Last control that worked per card number, tried first next time
+        self._read_controls: dict[str, str] = {}
+        self._write_controls: dict[str, str] = {}
+        # Last hardware enumeration as (ALSA_DEVICE_DIR mtime, devices)
+        self._devices_cache: tuple[int, list[AudioDevice]] | None = None
         if windows_mode:
             logger.warning("AudioManager running in Windows compatibility mode")
 
@@ -100,8 +259,13 @@ class AudioManager:
         """
         Get list of available audio devices.
 
-        Queries ALSA via `aplay -l` to enumerate hardware audio devices.
-        Always includes fallback virtual devices (null, default, dmix).
+        Reads /proc/asound/pcm to enumerate hardware audio devices, falling
+        back to `aplay -l` where procfs is unavailable. Always includes
+        fallback virtual devices (null, default, dmix).
+
+        Hardware devices are cached and reused until the mtime of
+        /dev/snd changes (i.e. a card is added or removed), at which point
+        cached mixer handles are dropped as well.
 
         Returns:
             List of audio device dictionaries, each containing:
@@ -110,6 +274,8 @@ class AudioManager:
             - card: ALSA card number or identifier
             - device: ALSA device number
         """
+        import subprocess
+
         if self.windows_mode:
             logger.info("Windows mode detected - returning simulated audio devices")
             return [
@@ -126,46 +292,33 @@ class AudioManager:
         ]
 
         try:
-            logger.debug("Attempting to detect hardware audio devices with aplay -l")
-            result = subprocess.run(["aplay", "-l"], capture_output=True, text=True, check=True)
-            devices = []
+            cache_key = os.stat(ALSA_DEVICE_DIR).st_mtime_ns
+        except OSError:
+            cache_key = None
 
-            logger.debug(f"aplay -l output:\n{result.stdout}")
+        cached = self._devices_cache
+        if cache_key is not None and cached is not None and cached[0] == cache_key:
+            return fallback_devices + cached[1]
 
-            # Parse actual audio devices
-            for line in result.stdout.split("\n"):
-                if "card" in line and ":" in line:
-                    # Parse line like "card 0: PCH [HDA Intel PCH], device 0: ALC887-VD Analog [ALC887-VD Analog]"
-                    parts = line.split(":")
-                    if len(parts) >= 2:
-                        card_info = parts[0].strip()
-                        device_info = parts[1].strip()
-                        # Extract card and device numbers
-                        try:
-                            card_num = card_info.split()[1]
-                            if "device" in line:
-                                device_num = line.split("device")[1].split(":")[0].strip()
-                                device_id = f"hw:{card_num},{device_num}"
-                                device_name = device_info.split("[")[0].strip() if "[" in device_info else device_info
-                                devices.append(
-                                    {
-                                        "id": device_id,
-                                        "name": f"{device_name} ({device_id})",
-                                        "card": card_num,
-                                        "device": device_num,
-                                    }
-                                )
-                                logger.debug(f"Found hardware device: {device_name} -> {device_id}")
-                        except (IndexError, ValueError) as e:
-                            logger.warning(f"Error parsing audio device line: {line} - {e}")
-                            continue
+        if cached is not None:
+            # Cards changed since the last scan, so open mixer handles may
+            # point at removed or renumbered cards
+            self._mixers.clear()
+
+        try:
+            devices = self._read_proc_pcm_devices()
+            if devices is None:
+                devices = self._read_aplay_devices()
+
+            if cache_key is not None:
+                self._devices_cache = (cache_key, devices)
 
             # If we found real devices, add them to fallback devices
             if devices:
                 logger.info(f"Found {len(devices)} hardware audio devices")
                 return fallback_devices + devices
             else:
-                logger.warning("No hardware audio devices found in aplay output, using fallback devices only")
+                logger.warning("No hardware audio devices found, using fallback devices only")
                 return fallback_devices
 
         except subprocess.CalledProcessError as e:
@@ -178,7 +331,85 @@ class AudioManager:
             logger.error(f"Unexpected error getting audio devices: {e}")
             return fallback_devices
 
-    def get_mixer_controls(self, device: str) -> list[str]:
+    def _read_proc_pcm_devices(self) -> list[AudioDevice] | None:
+        """
+        Enumerate playback devices from /proc/asound/pcm.
+
+        Returns:
+            List of hardware audio devices (possibly empty), or None if the
+            proc file is unavailable and the caller should fall back to aplay.
+        """
+        try:
+            with open(ALSA_PROC_PCM_PATH) as f:
+                content = f.read()
+        except OSError:
+            logger.debug(f"{ALSA_PROC_PCM_PATH} not readable, falling back to aplay -l")
+            return None
+
+        devices = []
+        for line in content.splitlines():
+            # Parse line like "00-00: ALC887-VD Analog : ALC887-VD Analog : playback 1 : capture 1"
+            fields = line.split(" : ")
+            if not any(field.startswith("playback") for field in fields[1:]):
+                continue  # Capture-only device
+
+            numbers, _, pcm_id = fields[0].partition(":")
+            card_str, _, device_str = numbers.partition("-")
+            if not (card_str.isdigit() and device_str.isdigit()):
+                logger.warning(f"Error parsing audio device line: {line}")
+                continue
+
+            card_num = str(int(card_str))
+            device_num = str(int(device_str))
+            device_id = f"hw:{card_num},{device_num}"
+            device_name = fields[1].strip() or pcm_id.strip()
+            devices.append(
+                {
+                    "id": device_id,
+                    "name": f"{device_name} ({device_id})",
+                    "card": card_num,
+                    "device": device_num,
+                }
+            )
+            logger.debug(f"Found hardware device: {device_name} -> {device_id}")
+
+        return devices
+
+    def _read_aplay_devices(self) -> list[AudioDevice]:
+        """
+        Enumerate playback devices by parsing `aplay -l` output.
+
+        Used when /proc/asound/pcm is not available.
+
+        Returns:
+            List of hardware audio devices (possibly empty).
+
+        Raises:
+            subprocess.CalledProcessError: If aplay exits with an error.
+            FileNotFoundError: If aplay is not installed.
+        """
+        logger.debug("Attempting to detect hardware audio devices with aplay -l")
+        result = _run_alsa_command(["aplay", "-l"])
+        devices = []
+
+        logger.debug(f"aplay -l output:\n{result.stdout}")
+
+        for match in ALSA_APLAY_DEVICE_PATTERN.finditer(result.stdout):
+            card_num, device_num, device_name = match.group(1, 3, 4)
+            device_id = f"hw:{card_num},{device_num}"
+            devices.append(
+                {
+                    "id": device_id,
+                    "name": f"{device_name} ({device_id})",
+                    "card": card_num,
+                    "device": device_num,
+                }
+            )
+            logger.debug(f"Found hardware device: {device_name} -> {device_id}")
+
+        return devices
+
+    def get_mixer_controls(self, device: str) -> Sequence[str]:
         """
         Get available ALSA mixer controls for a device.
 
@@ -189,25 +420,22 @@ class AudioManager:
             device: ALSA device identifier (e.g., 'hw:0,0').
 
         Returns:
-            List of control names (e.g., ['Master', 'PCM', 'Headphone']).
-            Returns DEFAULT_MIXER_CONTROLS for virtual devices.
+            Sequence of control names (e.g., ['Master', 'PCM', 'Headphone']).
+            Returns the immutable DEFAULT_MIXER_CONTROLS tuple for virtual
+            devices or when detection fails; callers must not mutate it.
         """
+        import subprocess
+
         if self.windows_mode or device in VIRTUAL_AUDIO_DEVICES:
-            return DEFAULT_MIXER_CONTROLS.copy()
+            return DEFAULT_MIXER_CONTROLS
 
         try:
             # Extract card number from device ID (e.g., "hw:0,0" -> "0")
-            card_match = ALSA_CARD_NUMBER_PATTERN.search(device)
-            if not card_match:
-                return DEFAULT_MIXER_CONTROLS.copy()
+            card_num = _parse_card_number(device)
+            if card_num is None:
+                return DEFAULT_MIXER_CONTROLS
 
-            card_num = card_match.group(1)
-            result = subprocess.run(
-                ["amixer", "-c", card_num, "scontrols"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            result = _run_alsa_command(["amixer", "-c", card_num, "scontrols"])
 
             controls = []
             for line in result.stdout.split("\n"):
@@ -217,18 +445,19 @@ class AudioManager:
                     if match:
                         controls.append(match.group(1))
 
-            return controls if controls else DEFAULT_MIXER_CONTROLS.copy()
+            return controls if controls else DEFAULT_MIXER_CONTROLS
 
         except (subprocess.CalledProcessError, FileNotFoundError) as e:
             logger.warning(f"Could not get mixer controls for device {device}: {e}")
-            return DEFAULT_MIXER_CONTROLS.copy()
+            return DEFAULT_MIXER_CONTROLS
 
     def get_volume(self, device: str, control: str = "Master") -> int:
         """
         Get the current volume for an audio device.
 
         Queries the ALSA mixer to read the current volume level. Tries multiple
-        control names (Master, PCM, etc.) until one works.
+        control names (Master, PCM, etc.) until one works, starting with the
+        control that last worked for the card.
 
         Args:
             device: ALSA device identifier (e.g., 'hw:0,0').
@@ -238,36 +467,25 @@ class AudioManager:
             Volume level as integer percentage (0-100).
             Returns DEFAULT_VOLUME_PERCENT for virtual devices or on error.
         """
+        import subprocess
+
         if self.windows_mode or device in VIRTUAL_AUDIO_DEVICES:
             logger.debug(f"Virtual device {device}, returning default volume")
             return DEFAULT_VOLUME_PERCENT
 
         try:
             # Extract card number from device ID (e.g., "hw:0,0" -> "0")
-            card_match = ALSA_CARD_NUMBER_PATTERN.search(device)
-            if not card_match:
+            card_num = _parse_card_number(device)
+            if card_num is None:
                 logger.debug(f"No card number found in device {device}, returning default volume")
                 return DEFAULT_VOLUME_PERCENT
 
-            card_num = card_match.group(1)
-
-            for control_name in VOLUME_READ_CONTROLS:
-                try:
-                    result = subprocess.run(
-                        ["amixer", "-c", card_num, "sget", control_name],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
-                    # Parse volume percentage from output (e.g., "[75%]" -> 75)
-                    volume_match = ALSA_VOLUME_PERCENT_PATTERN.search(result.stdout)
-                    if volume_match:
-                        volume = int(volume_match.group(1))
-                        logger.debug(f"Got volume {volume}% for device {device} control {control_name}")
-                        return volume
-                except subprocess.CalledProcessError:
-                    continue  # Try next control name
+            for control_name in _prioritize_control(VOLUME_READ_CONTROLS, self._read_controls.get(card_num)):
+                volume = self._read_control_volume(card_num, control_name)
+                if volume is not None:
+                    self._read_controls[card_num] = control_name
+                    logger.debug(f"Got volume {volume}% for device {device} control {control_name}")
+                    return volume
 
             # If no controls worked, return default
             logger.warning(f"Could not find working volume control for device {device}")
@@ -281,8 +499,10 @@ class AudioManager:
         """
         Set the volume for an audio device.
 
-        Uses amixer to set the volume level on the ALSA mixer. Tries multiple
-        control names (Master, PCM, etc.) until one works.
+        Sets the volume level on the ALSA mixer, in-process via pyalsaaudio
+        when installed or via amixer otherwise. Tries multiple control names
+        (Master, PCM, etc.) until one works, starting with the control that
+        last worked for the card.
 
         Args:
             device: ALSA device identifier (e.g., 'hw:0,0').
@@ -301,47 +521,127 @@ class AudioManager:
 
         try:
             # Extract card number from device ID (e.g., "hw:0,0" -> "0")
-            card_match = ALSA_CARD_NUMBER_PATTERN.search(device)
-            if not card_match:
+            card_num = _parse_card_number(device)
+            if card_num is None:
                 logger.debug(f"No card number found in device {device}, storing volume only")
                 return True, f"Volume set to {volume}% (no hardware control)"
 
-            card_num = card_match.group(1)
-
-            for control_name in VOLUME_WRITE_CONTROLS:
-                try:
-                    subprocess.run(
-                        ["amixer", "-c", card_num, "sset", control_name, f"{volume}%"],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
+            for control_name in _prioritize_control(VOLUME_WRITE_CONTROLS, self._write_controls.get(card_num)):
+                if self._write_control_volume(card_num, control_name, volume):
+                    self._write_controls[card_num] = control_name
                     logger.info(f"Set volume to {volume}% for device {device} control {control_name}")
                     return True, f"Volume set to {volume}% ({control_name})"
-                except subprocess.CalledProcessError as e:
-                    logger.debug(f"Control {control_name} failed for device {device}: {e}")
-                    continue  # Try next control name
 
             # If no controls worked
             logger.warning(f"Could not find working volume control for device {device}")
             return False, f"No working volume controls found for device {device}"
 
-        except subprocess.CalledProcessError as e:
-            # Handle both string and bytes stderr
-            if hasattr(e, "stderr") and e.stderr:
-                if isinstance(e.stderr, bytes):
-                    error_msg = e.stderr.decode()
-                else:
-                    error_msg = str(e.stderr)
-            else:
-                error_msg = str(e)
-            logger.warning(f"Could not set volume for device {device}: {error_msg}")
-            return False, f"Could not set volume: {error_msg}"
         except FileNotFoundError:
             logger.warning("amixer command not found")
             return False, "Audio mixer control not available"
 
+    def _get_mixer(self, card_num: str, control_name: str) -> Any:
+        """
+        Get a cached pyalsaaudio Mixer for a card's control.
+
+        Callers evict the entry when the handle raises ALSAAudioError, and
+        get_devices() clears the cache when the set of cards changes.
+
+        Args:
+            card_num: ALSA card number (e.g., '0').
+            control_name: Mixer control name (e.g., 'Master').
+
+        Returns:
+            alsaaudio.Mixer instance.
+
+        Raises:
+            alsaaudio.ALSAAudioError: If the control does not exist on the card.
+        """
+        key = (card_num, control_name)
+        mixer = self._mixers.get(key)
+        if mixer is None:
+            mixer = alsaaudio.Mixer(control_name, cardindex=int(card_num))
+            self._mixers[key] = mixer
+        return mixer
+
+    def _read_control_volume(self, card_num: str, control_name: str) -> int | None:
+        """
+        Read the volume of a single mixer control.
+
+        Uses pyalsaaudio in-process when available, otherwise amixer.
+
+        Args:
+            card_num: ALSA card number (e.g., '0').
+            control_name: Mixer control name (e.g., 'Master').
+
+        Returns:
+            Volume percentage, or None if the control is missing or
+            reports no volume.
+
+        Raises:
+            FileNotFoundError: If amixer is required but not installed.
+        """
+        import subprocess
+
+        if ALSAAUDIO_AVAILABLE:
+            try:
+                mixer = self._get_mixer(card_num, control_name)
+                # Apply pending ALSA events so changes made by other
+                # processes (amixer, the host) are visible to this handle
+                mixer.handleevents()
+                return int(mixer.getvolume()[0])
+            except alsaaudio.ALSAAudioError:
+                # The handle may belong to a card that was unplugged or
+                # renumbered; drop it so the next call reopens the control
+                self._mixers.pop((card_num, control_name), None)
+                return None
+            except IndexError:
+                return None
+
+        try:
+            result = _run_alsa_command(["amixer", "-c", card_num, "sget", control_name])
+        except subprocess.CalledProcessError:
+            return None
+
+        # Parse volume percentage from output (e.g., "[75%]" -> 75)
+        volume_match = ALSA_VOLUME_PERCENT_PATTERN.search(result.stdout)
+        return int(volume_match.group(1)) if volume_match else None
+
+    def _write_control_volume(self, card_num: str, control_name: str, volume: int) -> bool:
+        """
+        Set the volume of a single mixer control.
+
+        Uses pyalsaaudio in-process when available, otherwise amixer.
+
+        Args:
+            card_num: ALSA card number (e.g., '0').
+            control_name: Mixer control name (e.g., 'Master').
+            volume: Volume level as integer percentage (0-100).
+
+        Returns:
+            True if the control accepted the volume, False otherwise.
+
+        Raises:
+            FileNotFoundError: If amixer is required but not installed.
+        """
+        if ALSAAUDIO_AVAILABLE:
+            try:
+                self._get_mixer(card_num, control_name).setvolume(volume)
+                return True
+            except alsaaudio.ALSAAudioError as e:
+                logger.debug(f"Control {control_name} failed for card {card_num}: {e}")
+                self._mixers.pop((card_num, control_name), None)
+                return False
+
+        # Missing controls are expected while probing, so check the exit
+        # status rather than raising and catching CalledProcessError
+        result = _run_alsa_setter(["amixer", "-c", card_num, "sset", control_name, f"{volume}%"])
+        if result.returncode == 0:
+            return True
+        error_msg = result.stderr.decode(errors="replace").strip()
+        logger.debug(f"Control {control_name} failed for card {card_num}: {error_msg}")
+        return False
+
     def is_virtual_device(self, device: str) -> bool:
         """
         Check if a device is a virtual/software device.
@@ -469,6 +769,8 @@ class AudioManager:
         Returns:
             Tuple of (success: bool, message: str).
         """
+        import subprocess
+
         try:
             # speaker-test options:
             # -D device: ALSA device to use
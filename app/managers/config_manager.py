@@ -6,8 +6,14 @@ stored in YAML format. Integrates Pydantic schema validation
 for type safety and format correctness.
 """
 
+import contextlib
+import copy
+import hashlib
+import io
+import json
 import logging
 import os
+from collections.abc import Iterator
 from typing import Any
 
 import yaml
@@ -18,10 +24,52 @@ from schemas.player_config import (
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed C loader/dumper, falling back to the pure-Python
+# implementations when PyYAML was built without libyaml.
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+logger.debug(f"Using YAML loader {_SafeLoader.__name__} and dumper {_SafeDumper.__name__}")
+
+# How many leading bytes to inspect when deciding whether a file is JSON
+_JSON_SNIFF_BYTES = 64
+
 # Type alias for player configuration
 PlayerConfig = dict[str, Any]
 
 
+def _load_players(f: io.BufferedReader) -> Any:
+    """
+    Parse a players file, taking a JSON fast path when possible.
+
+    JSON is a subset of YAML, and the C-accelerated json decoder is much
+    faster than even libyaml. Files whose content starts with '{' are
+    tried as JSON first; anything else (including files saved by this
+    class, which use YAML block style) streams straight to the YAML
+    loader.
+
+    Args:
+        f: Players file opened in binary mode.
+
+    Returns:
+        The parsed document (None for an empty file).
+
+    Raises:
+        yaml.YAMLError: If the file is neither valid JSON nor valid YAML.
+    """
+    if f.peek(_JSON_SNIFF_BYTES)[:_JSON_SNIFF_BYTES].lstrip()[:1] == b"{":
+        data = f.read()
+        try:
+            return json.loads(data)
+        except ValueError:
+            return yaml.load(data, Loader=_SafeLoader)
+    return yaml.load(f, Loader=_SafeLoader)
+
+
 class ConfigValidationError(Exception):
     """
     Exception raised when player configuration validation fails.
@@ -96,6 +144,19 @@ class ConfigManager:
         self.validate_on_load = validate_on_load
         self.validate_on_save = validate_on_save
         self.players: dict[str, PlayerConfig] = {}
+        # (inode, mtime_ns, size) of the file behind _cached_players
+        self._stat_key: tuple[int, int, int] | None = None
+        # Pristine copy of the players last loaded from config_path
+        self._cached_players: dict[str, PlayerConfig] = {}
+        # (digest of the YAML written, stat key of the file afterwards) for
+        # the last save, used to skip rewriting identical contents
+        self._last_saved: tuple[bytes, tuple[int, int, int]] | None = None
+        # repr() of each player config as it was when it last passed schema
+        # validation, so save() only revalidates players that changed
+        self._validated: dict[str, str] = {}
+        # Players set inside batch() whose validation is deferred to its end;
+        # None when no batch is active
+        self._batch_pending: set[str] | None = None
 
         # Ensure config directory exists
         config_dir = os.path.dirname(config_path)
@@ -117,6 +178,10 @@ class ConfigManager:
         as warnings but skipped (not loaded), allowing valid configs
         to still be used.
 
+        If the file's inode, mtime and size are unchanged since the last
+        load, the previously parsed players are reused instead of parsing
+        and validating the file again.
+
         Returns:
             Dictionary of player configurations (only valid ones if
             validation is enabled).
@@ -126,10 +191,20 @@ class ConfigManager:
             - Logs errors if file reading or YAML parsing fails
             - Logs warnings for invalid player configurations
         """
-        if os.path.exists(self.config_path):
+        stat_key = self._file_stat_key()
+        if stat_key is not None:
+            if stat_key == self._stat_key:
+                # Copy so in-memory edits never leak into the cached snapshot
+                self.players = copy.deepcopy(self._cached_players)
+                logger.debug(f"Config file {self.config_path} unchanged, reusing parsed players")
+                return self.players
+            self._stat_key = None
+
             try:
-                with open(self.config_path) as f:
-                    raw_players = yaml.safe_load(f) or {}
+                # Binary mode lets the loader read and decode the file in
+                # chunks rather than receiving it as one decoded string
+                with open(self.config_path, "rb") as f:
+                    raw_players = _load_players(f) or {}
 
                 if self.validate_on_load and raw_players:
                     is_valid, errors, validated_players = validate_players_file(raw_players)
@@ -137,6 +212,7 @@ class ConfigManager:
                         for error in errors:
                             logger.warning(f"Skipping invalid config: {error}")
                     self.players = validated_players
+                    self._validated = {name: repr(config) for name, config in validated_players.items()}
                     logger.debug(
                         f"Loaded {len(self.players)} valid players from "
                         f"{self.config_path} ({len(raw_players) - len(self.players)} "
@@ -146,11 +222,15 @@ class ConfigManager:
                     self.players = raw_players
                     logger.debug(f"Loaded {len(self.players)} players from {self.config_path}")
 
+                self._cached_players = copy.deepcopy(self.players)
+                self._stat_key = stat_key
+
             except Exception as e:
                 logger.error(f"Error loading config from {self.config_path}: {e}")
                 self.players = {}
         else:
             logger.info(f"Config file {self.config_path} does not exist, starting fresh")
+            self._stat_key = None
             self.players = {}
 
         return self.players
@@ -162,9 +242,14 @@ class ConfigManager:
         Writes self.players dictionary to the config file in YAML format.
         Uses block style (not flow style) for human readability.
 
-        When validate_on_save is True, all configurations are validated
+        When validate_on_save is True, configurations are validated
         before saving. If any configuration is invalid, the save is
-        aborted and a ConfigValidationError is raised.
+        aborted and a ConfigValidationError is raised. Players whose
+        config is unchanged since it last passed validation are not
+        validated again.
+
+        If the serialized YAML is identical to what the last save wrote
+        and the file has not changed on disk since, the write is skipped.
 
         Returns:
             True if save was successful, False otherwise.
@@ -174,21 +259,41 @@ class ConfigManager:
                 player configuration is invalid.
 
         Side Effects:
-            - Writes to config_path
+            - Atomically replaces config_path (via a temporary .tmp file)
             - Logs errors if file writing fails
         """
-        # Validate before saving if enabled
+        # Validate before saving if enabled, skipping already-validated players
         if self.validate_on_save and self.players:
-            is_valid, errors, _ = validate_players_file(self.players)
-            if not is_valid:
-                raise ConfigValidationError(
-                    "Cannot save invalid configuration",
-                    errors=errors,
-                )
+            fingerprints = {name: repr(config) for name, config in self.players.items()}
+            changed = {
+                name: self.players[name]
+                for name, fingerprint in fingerprints.items()
+                if self._validated.get(name) != fingerprint
+            }
+            if changed:
+                is_valid, errors, _ = validate_players_file(changed)
+                if not is_valid:
+                    raise ConfigValidationError(
+                        "Cannot save invalid configuration",
+                        errors=errors,
+                    )
+            self._validated = fingerprints
 
         try:
-            with open(self.config_path, "w") as f:
-                yaml.dump(self.players, f, default_flow_style=False)
+            data = yaml.dump(self.players, Dumper=_SafeDumper, default_flow_style=False, encoding="utf-8")
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._last_saved is not None and self._last_saved == (digest, self._file_stat_key()):
+                logger.debug(f"Config unchanged, skipping write to {self.config_path}")
+                return True
+
+            # The file is about to change, so the parsed snapshot is stale
+            self._stat_key = None
+            self._last_saved = None
+
+            self._write_atomically(data)
+            stat_key = self._file_stat_key()
+            if stat_key is not None:
+                self._last_saved = (digest, stat_key)
             logger.debug(f"Saved {len(self.players)} players to {self.config_path}")
             return True
         except ConfigValidationError:
@@ -198,6 +303,48 @@ class ConfigManager:
             logger.error(f"Error saving config to {self.config_path}: {e}")
             return False
 
+    def _write_atomically(self, data: bytes) -> None:
+        """
+        Replace the config file with data in a single visible step.
+
+        Writes to a temporary file next to config_path, syncs it to disk
+        and renames it over the original, so readers and crashes only
+        ever see either the old or the new complete file.
+
+        Args:
+            data: Serialized YAML to write.
+
+        Raises:
+            OSError: If the temporary file cannot be written or renamed.
+        """
+        tmp_path = f"{self.config_path}.tmp"
+        # fdatasync is not available on every platform (e.g. macOS, Windows)
+        sync = getattr(os, "fdatasync", os.fsync)
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                sync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _file_stat_key(self) -> tuple[int, int, int] | None:
+        """
+        Identify the current version of the config file on disk.
+
+        Returns:
+            Tuple of (inode, mtime_ns, size), or None if the file does
+            not exist or cannot be stat'ed.
+        """
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def get_player(self, name: str) -> PlayerConfig | None:
         """
         Get a player configuration by name.
@@ -223,7 +370,8 @@ class ConfigManager:
             name: Name of the player.
             config: Player configuration dictionary.
             validate: Whether to validate the config before setting.
-                If None, uses self.validate_on_save setting.
+                If None, uses self.validate_on_save setting (deferred to
+                the end of the block inside batch()).
 
         Raises:
             ConfigValidationError: If validation is enabled and config
@@ -235,7 +383,9 @@ class ConfigManager:
         """
         should_validate = validate if validate is not None else self.validate_on_save
 
-        if should_validate:
+        if should_validate and validate is None and self._batch_pending is not None:
+            self._batch_pending.add(name)
+        elif should_validate:
             is_valid, error_msg, validated_config = validate_player_config(config, name)
             if not is_valid:
                 raise ConfigValidationError(
@@ -246,9 +396,90 @@ class ConfigManager:
             # Use the validated (normalized) config
             if validated_config:
                 config = validated_config
+            self._validated[name] = repr(config)
 
         self.players[name] = config
 
+    def set_players(
+        self,
+        configs: dict[str, PlayerConfig],
+        validate: bool | None = None,
+    ) -> None:
+        """
+        Set several player configurations at once.
+
+        All configurations are validated together before any is stored,
+        so either every player is set or none is.
+
+        Args:
+            configs: Dictionary mapping player names to configurations.
+            validate: Whether to validate the configs before setting.
+                If None, uses self.validate_on_save setting.
+
+        Raises:
+            ConfigValidationError: If validation is enabled and any
+                config is invalid.
+
+        Side Effects:
+            - Modifies self.players dictionary
+            - Does NOT automatically save (call save() explicitly)
+        """
+        should_validate = validate if validate is not None else self.validate_on_save
+
+        if should_validate and configs:
+            is_valid, errors, validated_configs = validate_players_file(configs)
+            if not is_valid:
+                raise ConfigValidationError(
+                    f"Invalid configuration for {len(errors)} player(s)",
+                    errors=errors,
+                )
+            # Use the validated (normalized) configs
+            configs = validated_configs
+            self._validated.update((name, repr(config)) for name, config in configs.items())
+
+        self.players.update(configs)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """
+        Group several changes into one validation pass and one save.
+
+        Inside the block, set_player() calls that would validate (the
+        default when validate_on_save is True) store the config as-is.
+        When the block exits normally, those players are validated
+        together and the configuration is saved once.
+
+        Yields:
+            This ConfigManager.
+
+        Raises:
+            ConfigValidationError: On exit, if any player set in the
+                block is invalid. The invalid configs remain in
+                self.players and nothing is saved.
+            OSError: On exit, if the batched configuration could not be
+                written to disk.
+
+        Example:
+            >>> with manager.batch():
+            ...     for name, config in imported.items():
+            ...         manager.set_player(name, config)
+        """
+        if self._batch_pending is not None:
+            # Nested batch: the outermost block validates and saves
+            yield self
+            return
+
+        self._batch_pending = set()
+        try:
+            yield self
+            pending = {name: self.players[name] for name in self._batch_pending if name in self.players}
+        finally:
+            self._batch_pending = None
+
+        self.set_players(pending, validate=True)
+        if not self.save():
+            raise OSError(f"Failed to save batched configuration to {self.config_path}")
+
     def delete_player(self, name: str) -> bool:
         """
         Delete a player configuration.
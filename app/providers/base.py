@@ -35,6 +35,12 @@ class PlayerProvider(ABC):
     # Binary/executable name
     binary_name: str = "unknown"
 
+    # Configuration fields that must be present
+    required_fields: tuple[str, ...] = ("name", "device")
+
+    # Whether build_fallback_command() can provide a fallback
+    fallback_supported: bool = False
+
     @abstractmethod
     def build_command(self, player: PlayerConfig, log_path: str) -> list[str]:
         """
@@ -131,6 +137,23 @@ class PlayerProvider(ABC):
         """
         pass
 
+    def prepare_config(self, config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Prepare configuration with provider defaults.
+
+        Merges user config over the provider's defaults. Providers that
+        generate values (MAC addresses, client IDs) override this.
+
+        Args:
+            config: User-provided configuration.
+
+        Returns:
+            Complete configuration dictionary.
+        """
+        result = self.get_default_config()
+        result.update(config)
+        return result
+
     def get_required_fields(self) -> list[str]:
         """
         Get list of required configuration fields.
@@ -138,7 +161,7 @@ class PlayerProvider(ABC):
         Returns:
             List of field names that must be present in config.
         """
-        return ["name", "device"]
+        return list(self.required_fields)
 
     def supports_volume_control(self) -> bool:
         """
@@ -156,7 +179,7 @@ class PlayerProvider(ABC):
         Returns:
             True if fallback is supported, False otherwise.
         """
-        return False
+        return self.fallback_supported
 
     def is_available(self) -> bool:
         """
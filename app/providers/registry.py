@@ -5,6 +5,8 @@ Handles registration, lookup, and lifecycle of provider instances.
 """
 
 import logging
+import sys
+import time
 from typing import Any
 
 from .base import PlayerProvider
@@ -14,6 +16,10 @@ logger = logging.getLogger(__name__)
 # Default provider type when not specified in config
 DEFAULT_PROVIDER = "squeezelite"
 
+# How long a provider's is_available() result is reused before rechecking.
+# Availability only changes if binaries are installed/removed at runtime.
+PROVIDER_AVAILABILITY_TTL_SECS = 30
+
 
 class ProviderRegistry:
     """
@@ -28,11 +34,15 @@ class ProviderRegistry:
         default_provider: The default provider type to use.
     """
 
+    __slots__ = ("_providers", "_provider_classes", "default_provider", "_availability")
+
     def __init__(self) -> None:
         """Initialize an empty provider registry."""
         self._providers: dict[str, PlayerProvider] = {}
         self._provider_classes: dict[str, type[PlayerProvider]] = {}
         self.default_provider = DEFAULT_PROVIDER
+        # provider type -> (monotonic time checked, is_available() result)
+        self._availability: dict[str, tuple[float, bool]] = {}
 
     def register_class(
         self,
@@ -46,8 +56,10 @@ class ProviderRegistry:
             provider_type: String identifier for this provider.
             provider_class: The provider class to register.
         """
+        provider_type = sys.intern(provider_type)
         self._provider_classes[provider_type] = provider_class
-        logger.debug(f"Registered provider class: {provider_type}")
+        self._availability.pop(provider_type, None)
+        logger.debug("Registered provider class: %s", provider_type)
 
     def register_instance(
         self,
@@ -61,8 +73,34 @@ class ProviderRegistry:
             provider_type: String identifier for this provider.
             provider: The provider instance to register.
         """
+        # Interned keys let lookups with interned strings match by identity
+        provider_type = sys.intern(provider_type)
         self._providers[provider_type] = provider
-        logger.debug(f"Registered provider instance: {provider_type}")
+        self._availability.pop(provider_type, None)
+        logger.debug("Registered provider instance: %s", provider_type)
+
+    def _is_available(self, provider_type: str, provider: PlayerProvider) -> bool:
+        """
+        Check whether a provider is available, reusing recent results.
+
+        is_available() searches PATH for the provider binary, so results
+        are cached for PROVIDER_AVAILABILITY_TTL_SECS.
+
+        Args:
+            provider_type: The provider type being checked.
+            provider: The provider instance registered for that type.
+
+        Returns:
+            True if the provider's binary is available.
+        """
+        now = time.monotonic()
+        cached = self._availability.get(provider_type)
+        if cached is not None and now - cached[0] < PROVIDER_AVAILABILITY_TTL_SECS:
+            return cached[1]
+
+        available = provider.is_available()
+        self._availability[provider_type] = (now, available)
+        return available
 
     def get(self, provider_type: str) -> PlayerProvider | None:
         """
@@ -88,7 +126,7 @@ class ProviderRegistry:
         """
         if provider_type is None:
             provider_type = self.default_provider
-        return self.get(provider_type)
+        return self._providers.get(provider_type)
 
     def get_for_player(self, player_config: dict[str, Any]) -> PlayerProvider | None:
         """
@@ -103,8 +141,7 @@ class ProviderRegistry:
         Returns:
             The provider instance for this player, or None if not found.
         """
-        provider_type = player_config.get("provider", self.default_provider)
-        return self.get(provider_type)
+        return self._providers.get(player_config.get("provider", self.default_provider))
 
     def has_provider(self, provider_type: str) -> bool:
         """
@@ -118,18 +155,64 @@ class ProviderRegistry:
         """
         return provider_type in self._providers
 
+    def snapshot(
+        self,
+        available_only: bool = True,
+    ) -> tuple[list[dict[str, str | bool]], list[str], str | None]:
+        """
+        Collect provider info, available types, and the default in one pass.
+
+        Each provider's availability is looked up once (through the
+        PROVIDER_AVAILABILITY_TTL_SECS cache), so callers needing several
+        of these views don't walk the registry repeatedly.
+
+        Args:
+            available_only: If True (default), the info list only includes
+                providers whose binary is available. Does not affect the
+                other two values.
+
+        Returns:
+            Tuple of (info_list, available_types, default_type), where
+            default_type is the configured default if available, else the
+            first available provider, else None.
+        """
+        info: list[dict[str, str | bool]] = []
+        available_types: list[str] = []
+        for provider_type, provider in self._providers.items():
+            is_available = self._is_available(provider_type, provider)
+            if is_available:
+                available_types.append(provider_type)
+            elif available_only:
+                continue
+            info.append(
+                {
+                    "type": provider_type,
+                    "display_name": provider.display_name,
+                    "binary": provider.binary_name,
+                    "available": is_available,
+                }
+            )
+
+        if self.default_provider in available_types:
+            default_type: str | None = self.default_provider
+        else:
+            default_type = available_types[0] if available_types else None
+
+        return info, available_types, default_type
+
     def list_providers(self, available_only: bool = False) -> list[str]:
         """
         Get list of registered provider types.
 
         Args:
-            available_only: If True, only return providers whose binary is available.
+            available_only: If True, only return providers whose binary is available
+                (checked at most every PROVIDER_AVAILABILITY_TTL_SECS).
 
         Returns:
             List of provider type strings.
         """
         if available_only:
-            return [ptype for ptype, provider in self._providers.items() if provider.is_available()]
+            return self.snapshot()[1]
         return list(self._providers.keys())
 
     def get_default_available_provider(self) -> str | None:
@@ -142,17 +225,7 @@ class ProviderRegistry:
         Returns:
             Provider type string, or None if no providers are available.
         """
-        # Check if default is available
-        default = self._providers.get(self.default_provider)
-        if default and default.is_available():
-            return self.default_provider
-
-        # Fall back to first available provider
-        for provider_type, provider in self._providers.items():
-            if provider.is_available():
-                return provider_type
-
-        return None
+        return self.snapshot()[2]
 
     def get_provider_info(self, available_only: bool = True) -> list[dict[str, str | bool]]:
         """
@@ -165,20 +238,7 @@ class ProviderRegistry:
         Returns:
             List of dictionaries with provider info (type, display_name, available).
         """
-        info: list[dict[str, str | bool]] = []
-        for provider_type, provider in self._providers.items():
-            is_available = provider.is_available()
-            if available_only and not is_available:
-                continue
-            info.append(
-                {
-                    "type": provider_type,
-                    "display_name": provider.display_name,
-                    "binary": provider.binary_name,
-                    "available": is_available,
-                }
-            )
-        return info
+        return self.snapshot(available_only)[0]
 
     def validate_player_config(
         self,
@@ -221,16 +281,10 @@ class ProviderRegistry:
             # Return as-is if provider not found
             return player_config
 
-        # Use provider's prepare method if available
-        if hasattr(provider, "prepare_config"):
-            return provider.prepare_config(player_config)
-
-        # Fallback: just merge with defaults
-        defaults = provider.get_default_config()
-        defaults.update(player_config)
-        return defaults
+        return provider.prepare_config(player_config)
 
     def clear(self) -> None:
         """Remove all registered providers."""
         self._providers.clear()
+        self._availability.clear()
         logger.debug("Cleared all providers from registry")
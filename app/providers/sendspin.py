@@ -6,9 +6,10 @@ and configuration validation for the Sendspin synchronized
 multi-room audio protocol.
 """
 
+import functools
 import hashlib
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 from .base import PlayerConfig, PlayerProvider
 
@@ -24,6 +25,29 @@ DEFAULT_LOG_LEVEL = "INFO"
 # Client ID prefix for generated IDs
 CLIENT_ID_PREFIX = "sendspin"
 
+# ALSA device name prefixes, which PortAudio (used by sendspin) can't open
+ALSA_DEVICE_PREFIXES = ("hw:", "plughw:")
+
+
+@functools.lru_cache(maxsize=256)
+def _client_id_for_name(name: str) -> str:
+    """
+    Generate a deterministic client ID for a player name, memoized.
+
+    Args:
+        name: Player name to hash.
+
+    Returns:
+        Client ID string.
+    """
+    # Create a short hash suffix for uniqueness. MD5 is kept (rather than a
+    # faster hash) so IDs stay stable for players whose config predates the
+    # stored client_id; it is not used for security.
+    hash_suffix = hashlib.md5(name.encode(), usedforsecurity=False).hexdigest()[:8]
+    # Sanitize name for use in ID (lowercase, replace spaces)
+    safe_name = name.lower().replace(" ", "-")[:20]
+    return f"{CLIENT_ID_PREFIX}-{safe_name}-{hash_suffix}"
+
 
 class SendspinProvider(PlayerProvider):
     """
@@ -43,6 +67,19 @@ class SendspinProvider(PlayerProvider):
     provider_type = "sendspin"
     display_name = "Sendspin"
     binary_name = "sendspin"
+    required_fields = ("name",)
+
+    # Default configuration; copied (never returned directly) since callers
+    # update the result with their own settings
+    _DEFAULTS: ClassVar[dict[str, Any]] = {
+        "provider": provider_type,
+        "device": "default",
+        "client_id": "",  # Will be auto-generated from name
+        "delay_ms": 0,
+        "log_level": DEFAULT_LOG_LEVEL,
+        "volume": 75,
+        "autostart": False,
+    }
 
     def __init__(self, audio_manager: Any) -> None:
         """
@@ -71,13 +108,19 @@ class SendspinProvider(PlayerProvider):
         Returns:
             Command arguments list.
         """
+        name = player["name"]
+        # Only hash the name when the config has no client_id
+        client_id = player.get("client_id")
+        if client_id is None:
+            client_id = self._generate_client_id(name)
+
         cmd = [
             self.binary_name,
             "--headless",  # Always run headless in our context
             "--name",
-            player["name"],
+            name,
             "--id",
-            player.get("client_id", self._generate_client_id(player["name"])),
+            client_id,
         ]
 
         # Add audio device if specified and compatible with PortAudio
@@ -88,11 +131,11 @@ class SendspinProvider(PlayerProvider):
         device = player.get("device", "default")
         if device and device != "default" and device != "null":
             # Skip ALSA-style device names (hw:X,Y format) - not compatible with PortAudio
-            if not device.startswith("hw:") and not device.startswith("plughw:"):
-                cmd.extend(["--audio-device", device])
+            if not device.startswith(ALSA_DEVICE_PREFIXES):
+                cmd += ("--audio-device", device)
             else:
                 logger.warning(
-                    f"Sendspin player '{player['name']}' configured with ALSA device '{device}' "
+                    f"Sendspin player '{name}' configured with ALSA device '{device}' "
                     "which is not compatible with PortAudio. Using system default audio device. "
                     "Use 'sendspin --list-audio-devices' to see available PortAudio devices."
                 )
@@ -100,11 +143,10 @@ class SendspinProvider(PlayerProvider):
         # Add latency compensation if specified
         delay_ms = player.get("delay_ms")
         if delay_ms is not None and delay_ms != 0:
-            cmd.extend(["--static-delay-ms", str(delay_ms)])
+            cmd += ("--static-delay-ms", str(delay_ms))
 
         # Set log level
-        log_level = player.get("log_level", DEFAULT_LOG_LEVEL)
-        cmd.extend(["--log-level", log_level])
+        cmd += ("--log-level", player.get("log_level", DEFAULT_LOG_LEVEL))
 
         return cmd
 
@@ -177,7 +219,7 @@ class SendspinProvider(PlayerProvider):
 
         # Validate delay_ms if provided
         delay_ms = config.get("delay_ms")
-        if delay_ms is not None:
+        if delay_ms is not None and not isinstance(delay_ms, int):
             try:
                 int(delay_ms)
             except (TypeError, ValueError):
@@ -192,23 +234,7 @@ class SendspinProvider(PlayerProvider):
         Returns:
             Default configuration dictionary.
         """
-        return {
-            "provider": self.provider_type,
-            "device": "default",
-            "client_id": "",  # Will be auto-generated from name
-            "delay_ms": 0,
-            "log_level": DEFAULT_LOG_LEVEL,
-            "volume": 75,
-            "autostart": False,
-        }
-
-    def get_required_fields(self) -> list[str]:
-        """Get required configuration fields."""
-        return ["name"]
-
-    def supports_fallback(self) -> bool:
-        """Sendspin doesn't have a fallback mechanism."""
-        return False
+        return self._DEFAULTS.copy()
 
     def _generate_client_id(self, name: str) -> str:
         """
@@ -217,17 +243,16 @@ class SendspinProvider(PlayerProvider):
         Creates a deterministic ID based on the player name,
         prefixed with 'sendspin-' for clarity.
 
+        Results are cached per name, since IDs are requested repeatedly
+        for the same players.
+
         Args:
             name: Player name to hash.
 
         Returns:
             Client ID string.
         """
-        # Create a short hash suffix for uniqueness
-        hash_suffix = hashlib.md5(name.encode()).hexdigest()[:8]
-        # Sanitize name for use in ID (lowercase, replace spaces)
-        safe_name = name.lower().replace(" ", "-")[:20]
-        return f"{CLIENT_ID_PREFIX}-{safe_name}-{hash_suffix}"
+        return _client_id_for_name(name)
 
     def prepare_config(self, config: dict[str, Any]) -> dict[str, Any]:
         """
@@ -243,8 +268,7 @@ class SendspinProvider(PlayerProvider):
             Complete configuration dictionary.
         """
         # Start with defaults
-        result = self.get_default_config()
-        result.update(config)
+        result = {**self._DEFAULTS, **config}
 
         # Generate client_id if not provided
         if not result.get("client_id") and result.get("name"):
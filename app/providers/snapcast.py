@@ -47,6 +47,7 @@ class SnapcastProvider(PlayerProvider):
     provider_type = "snapcast"
     display_name = "Snapcast"
     binary_name = "snapclient"
+    required_fields = ("name",)
 
     def __init__(self, audio_manager: Any) -> None:
         """
@@ -191,14 +192,6 @@ class SnapcastProvider(PlayerProvider):
             "autostart": False,
         }
 
-    def get_required_fields(self) -> list[str]:
-        """Get required configuration fields."""
-        return ["name"]
-
-    def supports_fallback(self) -> bool:
-        """Snapcast doesn't support fallback."""
-        return False
-
     @staticmethod
     def generate_host_id(name: str) -> str:
         """
@@ -7,10 +7,11 @@ and configuration validation.
 Supports both standalone Docker (ALSA) and HAOS (PulseAudio) environments.
 """
 
+import functools
 import hashlib
 import logging
 import os
-from typing import Any
+from typing import Any, ClassVar
 
 from environment import get_squeezelite_output_device
 
@@ -66,6 +67,45 @@ DEFAULT_SAMPLE_RATE = os.environ.get("SQUEEZELITE_SAMPLE_RATE", "44100")
 # this null device to maintain LMS connection without audio output.
 NULL_DEVICE = "null"
 
+# Argument tails shared by every squeezelite command. Built once since the
+# settings above are fixed at import time.
+_COMMON_TAIL = ("-a", DEFAULT_BUFFER_SIZE, "-b", DEFAULT_BUFFER_PARAMS, "-C", DEFAULT_CLOSE_TIMEOUT)
+_NULL_RATE_TAIL = ("-r", DEFAULT_SAMPLE_RATE)
+
+
+@functools.lru_cache(maxsize=256)
+def _mac_address_for_name(name: str) -> str:
+    """
+    Generate the MAC address for a player name, memoized.
+
+    See SqueezeliteProvider.generate_mac_address for the format.
+
+    Args:
+        name: Player name to hash.
+
+    Returns:
+        MAC address string in format XX:XX:XX:XX:XX:XX.
+    """
+    # Generate MD5 hash of the player name
+    # MD5 produces a 128-bit (16-byte) digest that is deterministic -
+    # the same input always produces the same output. It is flagged as
+    # not security-related so FIPS-restricted builds still allow it.
+    hash_bytes = hashlib.md5(name.encode(), usedforsecurity=False).digest()
+
+    # Extract first 6 bytes from the hash for the MAC address
+    # Use first 6 bytes, set locally administered bit (0x02)
+    # and clear multicast bit (0x01) on first octet
+    mac_bytes = bytearray(hash_bytes[:6])
+
+    # Modify the first octet to comply with IEEE 802 MAC address standards:
+    # - OR with 0x02: Sets the locally-administered bit (bit 1)
+    # - AND with 0xFE: Clears the multicast bit (bit 0)
+    # This creates a locally-administered unicast MAC address
+    mac_bytes[0] = (mac_bytes[0] | 0x02) & 0xFE
+
+    # Format as standard colon-separated hex string (e.g., "a2:3f:4d:1e:8c:9b")
+    return mac_bytes.hex(":")
+
 
 class SqueezeliteProvider(PlayerProvider):
     """
@@ -82,6 +122,19 @@ class SqueezeliteProvider(PlayerProvider):
     provider_type = "squeezelite"
     display_name = "Squeezelite"
     binary_name = "squeezelite"
+    required_fields = ("name", "device")
+    fallback_supported = True  # Falls back to the null device
+
+    # Default configuration; copied (never returned directly) since callers
+    # update the result with their own settings
+    _DEFAULTS: ClassVar[dict[str, Any]] = {
+        "provider": provider_type,
+        "device": "default",
+        "server_ip": "",
+        "mac_address": "",  # Will be auto-generated
+        "volume": 75,
+        "autostart": False,
+    }
 
     def __init__(self, audio_manager: Any) -> None:
         """
@@ -108,8 +161,12 @@ class SqueezeliteProvider(PlayerProvider):
             Command arguments list.
         """
         # Transform device name for environment (ALSA → pulse for HAOS)
-        output_device = get_squeezelite_output_device(player["device"])
+        device = player["device"]
+        output_device = get_squeezelite_output_device(device)
 
+        # Built as one literal: optional server and null-device sample rate
+        # arguments are unpacked in place
+        server_ip = player.get("server_ip")
         cmd = [
             self.binary_name,
             "-n",
@@ -118,31 +175,13 @@ class SqueezeliteProvider(PlayerProvider):
             output_device,
             "-m",
             player["mac_address"],
+            *(("-s", server_ip) if server_ip else ()),
+            "-f",
+            log_path,
+            *_COMMON_TAIL,
+            *(_NULL_RATE_TAIL if device == NULL_DEVICE else ()),
         ]
 
-        # Add server if specified
-        if player.get("server_ip"):
-            cmd.extend(["-s", player["server_ip"]])
-
-        # Add logging
-        cmd.extend(["-f", log_path])
-
-        # Add buffer and compatibility options
-        cmd.extend(
-            [
-                "-a",
-                DEFAULT_BUFFER_SIZE,
-                "-b",
-                DEFAULT_BUFFER_PARAMS,
-                "-C",
-                DEFAULT_CLOSE_TIMEOUT,
-            ]
-        )
-
-        # Null device needs explicit sample rate
-        if player["device"] == NULL_DEVICE:
-            cmd.extend(["-r", DEFAULT_SAMPLE_RATE])
-
         return cmd
 
     def build_fallback_command(self, player: PlayerConfig, log_path: str) -> list[str]:
@@ -159,6 +198,7 @@ class SqueezeliteProvider(PlayerProvider):
         Returns:
             Command arguments for null device fallback.
         """
+        server_ip = player.get("server_ip")
         cmd = [
             self.binary_name,
             "-n",
@@ -167,26 +207,13 @@ class SqueezeliteProvider(PlayerProvider):
             NULL_DEVICE,
             "-m",
             player["mac_address"],
+            *(("-s", server_ip) if server_ip else ()),
+            "-f",
+            log_path,
+            *_COMMON_TAIL,
+            *_NULL_RATE_TAIL,
         ]
 
-        if player.get("server_ip"):
-            cmd.extend(["-s", player["server_ip"]])
-
-        cmd.extend(["-f", log_path])
-
-        cmd.extend(
-            [
-                "-a",
-                DEFAULT_BUFFER_SIZE,
-                "-b",
-                DEFAULT_BUFFER_PARAMS,
-                "-C",
-                DEFAULT_CLOSE_TIMEOUT,
-                "-r",
-                DEFAULT_SAMPLE_RATE,
-            ]
-        )
-
         return cmd
 
     def get_volume(self, player: PlayerConfig) -> int:
@@ -229,14 +256,14 @@ class SqueezeliteProvider(PlayerProvider):
         Returns:
             Tuple of (is_valid, error_message).
         """
-        if not config.get("name"):
+        name = config.get("name")
+        if not name:
             return False, "Player name is required"
 
         if not config.get("device"):
             return False, "Audio device is required"
 
         # Name should be reasonable length
-        name = config["name"]
         if len(name) > 64:
             return False, "Player name too long (max 64 characters)"
 
@@ -253,22 +280,7 @@ class SqueezeliteProvider(PlayerProvider):
         Returns:
             Default configuration dictionary.
         """
-        return {
-            "provider": self.provider_type,
-            "device": "default",
-            "server_ip": "",
-            "mac_address": "",  # Will be auto-generated
-            "volume": 75,
-            "autostart": False,
-        }
-
-    def get_required_fields(self) -> list[str]:
-        """Get required configuration fields."""
-        return ["name", "device"]
-
-    def supports_fallback(self) -> bool:
-        """Squeezelite supports null device fallback."""
-        return True
+        return self._DEFAULTS.copy()
 
     @staticmethod
     def generate_mac_address(name: str) -> str:
@@ -308,30 +320,16 @@ class SqueezeliteProvider(PlayerProvider):
             player gets a unique identifier that Logitech Media Server can use
             to distinguish and remember individual players.
 
+        Results are cached per name, since the same players are prepared
+        repeatedly across config reloads.
+
         Args:
             name: Player name to hash.
 
         Returns:
             MAC address string in format XX:XX:XX:XX:XX:XX.
         """
-        # Generate MD5 hash of the player name
-        # MD5 produces a 128-bit (16-byte) digest that is deterministic -
-        # the same input always produces the same output
-        hash_bytes = hashlib.md5(name.encode()).digest()
-
-        # Extract first 6 bytes from the hash for the MAC address
-        # Use first 6 bytes, set locally administered bit (0x02)
-        # and clear multicast bit (0x01) on first octet
-        mac_bytes = list(hash_bytes[:6])
-
-        # Modify the first octet to comply with IEEE 802 MAC address standards:
-        # - OR with 0x02: Sets the locally-administered bit (bit 1)
-        # - AND with 0xFE: Clears the multicast bit (bit 0)
-        # This creates a locally-administered unicast MAC address
-        mac_bytes[0] = (mac_bytes[0] | 0x02) & 0xFE
-
-        # Format as standard colon-separated hex string (e.g., "a2:3f:4d:1e:8c:9b")
-        return ":".join(f"{b:02x}" for b in mac_bytes)
+        return _mac_address_for_name(name)
 
     def prepare_config(self, config: dict[str, Any]) -> dict[str, Any]:
         """
@@ -347,11 +345,12 @@ class SqueezeliteProvider(PlayerProvider):
             Complete configuration dictionary.
         """
         # Start with defaults
-        result = self.get_default_config()
-        result.update(config)
+        result = {**self._DEFAULTS, **config}
 
-        # Generate MAC if not provided
-        if not result.get("mac_address") and result.get("name"):
-            result["mac_address"] = self.generate_mac_address(result["name"])
+        # Generate MAC if not provided (the key is always present from defaults)
+        if not result["mac_address"]:
+            name = result.get("name")
+            if name:
+                result["mac_address"] = self.generate_mac_address(name)
 
         return result
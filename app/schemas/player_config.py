@@ -295,6 +295,12 @@ class SendspinPlayerConfig(BasePlayerConfig):
 # Union type for any valid player configuration
 PlayerConfigSchema = SqueezelitePlayerConfig | SendspinPlayerConfig
 
+# Schema class for each provider type, looked up once per validation
+PROVIDER_SCHEMAS: dict[str, type[BasePlayerConfig]] = {
+    "squeezelite": SqueezelitePlayerConfig,
+    "sendspin": SendspinPlayerConfig,
+}
+
 
 # =============================================================================
 # VALIDATION FUNCTIONS
@@ -369,19 +375,17 @@ def validate_player_config(
     # Determine provider type
     provider = config.get("provider", "squeezelite")
 
-    try:
-        validated: BasePlayerConfig
-        if provider == "sendspin":
-            validated = SendspinPlayerConfig.model_validate(config)
-        elif provider == "squeezelite":
-            validated = SqueezelitePlayerConfig.model_validate(config)
-        else:
-            return (
-                False,
-                f"Unknown provider type: {provider!r}. Supported providers: squeezelite, sendspin",
-                None,
-            )
+    # Non-string values (e.g. a YAML list) may be unhashable
+    schema_class = PROVIDER_SCHEMAS.get(provider) if isinstance(provider, str) else None
+    if schema_class is None:
+        return (
+            False,
+            f"Unknown provider type: {provider!r}. Supported providers: squeezelite, sendspin",
+            None,
+        )
 
+    try:
+        validated = schema_class.model_validate(config)
         return True, "", validated.model_dump()
 
     except Exception as e:
@@ -462,16 +466,11 @@ def get_schema_for_provider(provider: str) -> type[BasePlayerConfig]:
     Raises:
         ValueError: If provider type is unknown.
     """
-    schemas = {
-        "squeezelite": SqueezelitePlayerConfig,
-        "sendspin": SendspinPlayerConfig,
-    }
-
-    if provider not in schemas:
-        valid = ", ".join(sorted(schemas.keys()))
+    if provider not in PROVIDER_SCHEMAS:
+        valid = ", ".join(sorted(PROVIDER_SCHEMAS.keys()))
         raise ValueError(f"Unknown provider: {provider!r}. Valid providers: {valid}")
 
-    return schemas[provider]  # type: ignore[return-value]
+    return PROVIDER_SCHEMAS[provider]
 
 
 def get_default_config(provider: str) -> dict[str, Any]:
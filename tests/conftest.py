@@ -5,16 +5,11 @@ This module provides reusable fixtures for mocking and testing
 the Multi Output Player application components.
 """
 
-import sys
-from pathlib import Path
-from unittest.mock import Mock
+import subprocess
+from unittest.mock import Mock, patch
 
 import pytest
-
-# Add the app directory to sys.path so we can import modules
-app_dir = Path(__file__).parent.parent / "app"
-sys.path.insert(0, str(app_dir))
-
+import yaml
 
 # =============================================================================
 # FIXTURES - Configuration Files
@@ -40,8 +35,11 @@ def temp_log_dir(tmp_path):
 # FIXTURES - Sample Player Configurations
 # =============================================================================
 
+# The sample, minimal, and invalid configurations are session-scoped and
+# shared between tests: copy one before modifying it.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_squeezelite_config():
     """Sample valid Squeezelite player configuration."""
     return {
@@ -56,7 +54,7 @@ def sample_squeezelite_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sendspin_config():
     """Sample valid Sendspin player configuration."""
     return {
@@ -73,7 +71,7 @@ def sample_sendspin_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_snapcast_config():
     """Sample valid Snapcast player configuration."""
     return {
@@ -89,7 +87,7 @@ def sample_snapcast_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_players_dict(sample_squeezelite_config, sample_sendspin_config):
     """Sample dictionary of multiple player configurations."""
     return {
@@ -98,7 +96,7 @@ def sample_players_dict(sample_squeezelite_config, sample_sendspin_config):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_squeezelite_config():
     """Minimal valid Squeezelite configuration (required fields only)."""
     return {
@@ -108,7 +106,7 @@ def minimal_squeezelite_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_sendspin_config():
     """Minimal valid Sendspin configuration (required fields only)."""
     return {
@@ -117,7 +115,7 @@ def minimal_sendspin_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_snapcast_config():
     """Minimal valid Snapcast configuration (required fields only)."""
     return {
@@ -131,7 +129,7 @@ def minimal_snapcast_config():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_missing_name():
     """Invalid config - missing required name field."""
     return {
@@ -140,7 +138,7 @@ def invalid_config_missing_name():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_invalid_volume():
     """Invalid config - volume out of range."""
     return {
@@ -151,7 +149,7 @@ def invalid_config_invalid_volume():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_bad_mac():
     """Invalid config - malformed MAC address."""
     return {
@@ -162,7 +160,7 @@ def invalid_config_bad_mac():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_bad_provider():
     """Invalid config - unknown provider type."""
     return {
@@ -172,7 +170,7 @@ def invalid_config_bad_provider():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_sendspin_alsa_device():
     """Invalid config - Sendspin with ALSA device format."""
     return {
@@ -182,7 +180,7 @@ def invalid_config_sendspin_alsa_device():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_bad_log_level():
     """Invalid config - invalid Sendspin log level."""
     return {
@@ -197,7 +195,7 @@ def invalid_config_bad_log_level():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_aplay_output():
     """Mock output from 'aplay -l' command."""
     return """**** List of PLAYBACK Hardware Devices ****
@@ -210,7 +208,16 @@ card 1: HDMI [HDA Intel HDMI], device 3: HDMI 0 [HDMI 0]
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_proc_asound_pcm():
+    """Mock contents of /proc/asound/pcm."""
+    return """00-00: ALC887-VD Analog : ALC887-VD Analog : playback 1 : capture 1
+00-02: ALC887-VD Alt Analog : ALC887-VD Alt Analog : capture 1
+01-03: HDMI 0 : HDMI 0 : playback 1
+"""
+
+
+@pytest.fixture(scope="session")
 def mock_amixer_scontrols_output():
     """Mock output from 'amixer scontrols' command."""
     return """Simple mixer control 'Master',0
@@ -219,7 +226,7 @@ Simple mixer control 'Headphone',0
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_amixer_get_volume_output():
     """Mock output from 'amixer sget Master' command."""
     return """Simple mixer control 'Master',0
@@ -237,10 +244,23 @@ def mock_amixer_get_volume_output():
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def _shared_mock_process():
+    """Popen-spec mock reused by mock_process across the session."""
+    return Mock(spec=subprocess.Popen)
+
+
+@pytest.fixture(scope="session")
+def _shared_mock_failed_process():
+    """Popen-spec mock reused by mock_failed_process across the session."""
+    return Mock(spec=subprocess.Popen)
+
+
 @pytest.fixture
-def mock_process():
-    """Mock subprocess.Popen object."""
-    process = Mock()
+def mock_process(_shared_mock_process):
+    """Mock subprocess.Popen object (shared mock, reset for each test)."""
+    process = _shared_mock_process
+    process.reset_mock(return_value=True, side_effect=True)
     process.pid = 12345
     process.poll.return_value = None  # Process is running
     process.communicate.return_value = (b"stdout", b"stderr")
@@ -249,9 +269,10 @@ def mock_process():
 
 
 @pytest.fixture
-def mock_failed_process():
-    """Mock subprocess.Popen object that failed to start."""
-    process = Mock()
+def mock_failed_process(_shared_mock_failed_process):
+    """Mock subprocess.Popen object that failed to start (shared, reset per test)."""
+    process = _shared_mock_failed_process
+    process.reset_mock(return_value=True, side_effect=True)
     process.pid = 12346
     process.poll.return_value = 1  # Process terminated immediately
     process.communicate.return_value = (b"", b"Error: Device not found")
@@ -266,11 +287,9 @@ def mock_failed_process():
 @pytest.fixture
 def mock_yaml_file(tmp_path, sample_players_dict):
     """Create a temporary YAML file with sample player configurations."""
-    import yaml
-
     config_file = tmp_path / "players.yaml"
     with open(config_file, "w") as f:
-        yaml.dump(sample_players_dict, f)
+        yaml.dump(sample_players_dict, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
     return str(config_file)
 
 
@@ -299,7 +318,7 @@ def corrupt_yaml_file(tmp_path):
 @pytest.fixture
 def mock_subprocess_run():
     """Mock subprocess.run for testing without actual system calls."""
-    with pytest.mock.patch("subprocess.run") as mock:
+    with patch("subprocess.run") as mock:
         mock.return_value = Mock(
             returncode=0,
             stdout="",
@@ -311,19 +330,19 @@ def mock_subprocess_run():
 @pytest.fixture
 def mock_subprocess_popen():
     """Mock subprocess.Popen for testing without actual system calls."""
-    with pytest.mock.patch("subprocess.Popen") as mock:
+    with patch("subprocess.Popen") as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_os_makedirs():
     """Mock os.makedirs to avoid filesystem operations."""
-    with pytest.mock.patch("os.makedirs") as mock:
+    with patch("os.makedirs") as mock:
         yield mock
 
 
 @pytest.fixture
 def mock_os_path_exists():
     """Mock os.path.exists for testing file existence checks."""
-    with pytest.mock.patch("os.path.exists") as mock:
+    with patch("os.path.exists") as mock:
         yield mock
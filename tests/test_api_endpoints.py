@@ -5,19 +5,12 @@ Tests HTTP endpoints defined in app/common.py for player management
 operations using Flask test client with mocked manager methods.
 """
 
-# Import route registration function
-import sys
-from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+from common import register_routes
 from flask import Flask
 
-app_dir = Path(__file__).parent.parent / "app"
-sys.path.insert(0, str(app_dir))
-
-from common import register_routes  # noqa: E402
-
 # =============================================================================
 # FIXTURES
 # =============================================================================
@@ -43,34 +36,101 @@ def mock_squeezelite_manager():
     return manager
 
 
-@pytest.fixture
-def app(mock_manager):
-    """Create Flask test application with registered routes."""
+class _ManagerProxy:
+    """
+    Stand-in manager that forwards attribute access to the current test's mock.
+
+    Routes close over the manager passed to register_routes(), so binding
+    them to a proxy lets each Flask app be built once per session while
+    every test still gets a fresh mock manager.
+    """
+
+    def __init__(self) -> None:
+        self.target = None
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+def _build_app(manager):
+    """Create a Flask test application with routes bound to manager."""
     flask_app = Flask(__name__)
     flask_app.config["TESTING"] = True
-    register_routes(flask_app, mock_manager)
+    register_routes(flask_app, manager)
     return flask_app
 
 
+@pytest.fixture(scope="session")
+def _manager_proxy():
+    """Session-wide manager proxy for the PlayerManager-style app."""
+    return _ManagerProxy()
+
+
+@pytest.fixture(scope="session")
+def _squeezelite_manager_proxy():
+    """Session-wide manager proxy for the SqueezeliteManager-style app."""
+    return _ManagerProxy()
+
+
+@pytest.fixture(scope="session")
+def _session_app(_manager_proxy):
+    """Flask app with routes registered once for the whole session."""
+    return _build_app(_manager_proxy)
+
+
+@pytest.fixture(scope="session")
+def _session_app_squeezelite(_squeezelite_manager_proxy):
+    """Flask app (SqueezeliteManager) with routes registered once per session."""
+    return _build_app(_squeezelite_manager_proxy)
+
+
 @pytest.fixture
-def app_squeezelite(mock_squeezelite_manager):
-    """Create Flask test application with SqueezeliteManager."""
-    flask_app = Flask(__name__)
-    flask_app.config["TESTING"] = True
-    register_routes(flask_app, mock_squeezelite_manager)
-    return flask_app
+def app(_session_app, _manager_proxy, mock_manager):
+    """Flask test application with routes bound to this test's mock_manager."""
+    _manager_proxy.target = mock_manager
+    return _session_app
+
+
+@pytest.fixture
+def app_squeezelite(_session_app_squeezelite, _squeezelite_manager_proxy, mock_squeezelite_manager):
+    """Flask test application bound to this test's SqueezeliteManager mock."""
+    _squeezelite_manager_proxy.target = mock_squeezelite_manager
+    return _session_app_squeezelite
+
+
+@pytest.fixture
+def use_manager(app, _manager_proxy):
+    """Return a function that binds a test-specific manager in place of mock_manager."""
+
+    def _use(manager):
+        _manager_proxy.target = manager
+        return manager
+
+    return _use
+
+
+@pytest.fixture(scope="session")
+def _session_client(_session_app):
+    """Flask test client created once for the whole session."""
+    return _session_app.test_client()
+
+
+@pytest.fixture(scope="session")
+def _session_client_squeezelite(_session_app_squeezelite):
+    """Flask test client (SqueezeliteManager) created once for the whole session."""
+    return _session_app_squeezelite.test_client()
 
 
 @pytest.fixture
-def client(app):
-    """Create Flask test client."""
-    return app.test_client()
+def client(app, _session_client):
+    """Flask test client, bound to this test's mock_manager via app."""
+    return _session_client
 
 
 @pytest.fixture
-def client_squeezelite(app_squeezelite):
-    """Create Flask test client for SqueezeliteManager."""
-    return app_squeezelite.test_client()
+def client_squeezelite(app_squeezelite, _session_client_squeezelite):
+    """Flask test client for SqueezeliteManager, bound via app_squeezelite."""
+    return _session_client_squeezelite
 
 
 # =============================================================================
@@ -242,9 +302,9 @@ class TestCreatePlayer:
         assert data["success"] is False
         assert data["message"] == "Player already exists"
 
-    def test_create_player_no_create_method(self, client, mock_manager):
+    def test_create_player_no_create_method(self, client, use_manager):
         """Test create player when manager lacks create_player method."""
-        del mock_manager.create_player
+        use_manager(Mock(spec=["players", "providers"]))
 
         response = client.post(
             "/api/players",
@@ -387,9 +447,9 @@ class TestUpdatePlayer:
         data = response.get_json()
         assert data["success"] is False
 
-    def test_update_player_no_update_method(self, client, mock_manager):
+    def test_update_player_no_update_method(self, client, use_manager):
         """Test update player when manager lacks update_player method."""
-        del mock_manager.update_player
+        use_manager(Mock(spec=["players", "providers"]))
 
         response = client.put(
             "/api/players/Kitchen",
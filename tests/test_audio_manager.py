@@ -5,9 +5,11 @@ Tests audio device detection, mixer control enumeration, and volume
 control operations with mocked subprocess calls.
 """
 
+import os
 import subprocess
 from unittest.mock import Mock, patch
 
+import pytest
 from managers.audio_manager import (
     DEFAULT_MIXER_CONTROLS,
     DEFAULT_VOLUME_PERCENT,
@@ -17,6 +19,14 @@ from managers.audio_manager import (
     AudioManager,
 )
 
+
+@pytest.fixture(autouse=True)
+def no_alsaaudio():
+    """Exercise the amixer code path regardless of pyalsaaudio being installed."""
+    with patch("managers.audio_manager.ALSAAUDIO_AVAILABLE", False):
+        yield
+
+
 # =============================================================================
 # TESTS - Initialization
 # =============================================================================
@@ -42,7 +52,13 @@ class TestAudioManagerInit:
 
 
 class TestAudioManagerGetDevices:
-    """Tests for AudioManager.get_devices() method."""
+    """Tests for AudioManager.get_devices() method (aplay fallback path)."""
+
+    @pytest.fixture(autouse=True)
+    def no_proc_asound(self, tmp_path):
+        """Force the aplay fallback by pointing procfs at a missing file."""
+        with patch("managers.audio_manager.ALSA_PROC_PCM_PATH", str(tmp_path / "missing")):
+            yield
 
     def test_get_devices_windows_mode(self):
         """Test get_devices in Windows mode returns simulated devices."""
@@ -147,6 +163,114 @@ class TestAudioManagerGetDevices:
         assert "ALC887-VD Analog" in hw00["name"]
 
 
+class TestAudioManagerGetDevicesProc:
+    """Tests for AudioManager.get_devices() reading /proc/asound/pcm."""
+
+    @pytest.fixture
+    def proc_pcm(self, tmp_path, mock_proc_asound_pcm):
+        """Write mock /proc/asound/pcm contents and point the manager at them."""
+        pcm_file = tmp_path / "pcm"
+        pcm_file.write_text(mock_proc_asound_pcm)
+        with patch("managers.audio_manager.ALSA_PROC_PCM_PATH", str(pcm_file)):
+            yield pcm_file
+
+    @patch("subprocess.run")
+    def test_get_devices_from_proc(self, mock_run, proc_pcm):
+        """Test get_devices parses procfs without running aplay."""
+        manager = AudioManager(windows_mode=False)
+        devices = manager.get_devices()
+
+        hw00 = next(d for d in devices if d["id"] == "hw:0,0")
+        assert hw00["card"] == "0"
+        assert hw00["device"] == "0"
+        assert "ALC887-VD Analog" in hw00["name"]
+        assert any(d["id"] == "hw:1,3" for d in devices)
+        mock_run.assert_not_called()
+
+    def test_get_devices_from_proc_skips_capture_only(self, proc_pcm):
+        """Test get_devices ignores devices without playback streams."""
+        manager = AudioManager(windows_mode=False)
+        devices = manager.get_devices()
+
+        assert not any(d["id"] == "hw:0,2" for d in devices)
+        assert len(devices) == 5  # 3 fallback + 2 playback
+
+    @patch("subprocess.run")
+    def test_get_devices_from_empty_proc(self, mock_run, proc_pcm):
+        """Test get_devices with no PCM devices listed returns fallbacks only."""
+        proc_pcm.write_text("")
+
+        manager = AudioManager(windows_mode=False)
+        devices = manager.get_devices()
+
+        assert len(devices) == 3
+        mock_run.assert_not_called()
+
+
+class TestAudioManagerGetDevicesCache:
+    """Tests for caching hardware enumeration in AudioManager.get_devices()."""
+
+    @pytest.fixture
+    def snd_dir(self, tmp_path, mock_proc_asound_pcm):
+        """Point the manager at mock procfs contents and a fake /dev/snd."""
+        pcm_file = tmp_path / "pcm"
+        pcm_file.write_text(mock_proc_asound_pcm)
+        snd_dir = tmp_path / "snd"
+        snd_dir.mkdir()
+        with (
+            patch("managers.audio_manager.ALSA_PROC_PCM_PATH", str(pcm_file)),
+            patch("managers.audio_manager.ALSA_DEVICE_DIR", str(snd_dir)),
+        ):
+            yield snd_dir
+
+    def test_get_devices_reuses_cached_enumeration(self, snd_dir):
+        """Test get_devices skips enumeration while /dev/snd is unchanged."""
+        manager = AudioManager(windows_mode=False)
+        first = manager.get_devices()
+
+        with patch.object(AudioManager, "_read_proc_pcm_devices") as mock_read:
+            second = manager.get_devices()
+
+        mock_read.assert_not_called()
+        assert second == first
+
+    def test_get_devices_rescans_after_hotplug(self, snd_dir):
+        """Test get_devices re-enumerates when /dev/snd mtime changes."""
+        manager = AudioManager(windows_mode=False)
+        manager.get_devices()
+
+        mtime_ns = snd_dir.stat().st_mtime_ns + 1_000_000_000
+        os.utime(snd_dir, ns=(mtime_ns, mtime_ns))
+        with patch.object(AudioManager, "_read_proc_pcm_devices", return_value=[]) as mock_read:
+            devices = manager.get_devices()
+
+        mock_read.assert_called_once()
+        assert len(devices) == 3
+
+    def test_get_devices_rescan_drops_mixers(self, snd_dir):
+        """Test mixer handles are discarded when /dev/snd changes."""
+        manager = AudioManager(windows_mode=False)
+        manager.get_devices()
+        manager._mixers[("1", "Master")] = Mock()
+
+        mtime_ns = snd_dir.stat().st_mtime_ns + 1_000_000_000
+        os.utime(snd_dir, ns=(mtime_ns, mtime_ns))
+        manager.get_devices()
+
+        assert manager._mixers == {}
+
+    def test_get_devices_no_cache_without_device_dir(self, snd_dir):
+        """Test get_devices always enumerates when /dev/snd is missing."""
+        snd_dir.rmdir()
+        manager = AudioManager(windows_mode=False)
+        manager.get_devices()
+
+        with patch.object(AudioManager, "_read_proc_pcm_devices", return_value=[]) as mock_read:
+            manager.get_devices()
+
+        mock_read.assert_called_once()
+
+
 # =============================================================================
 # TESTS - Get Mixer Controls
 # =============================================================================
@@ -281,6 +405,23 @@ class TestAudioManagerGetVolume:
         assert volume == 75
         assert mock_run.call_count >= 2
 
+    @patch("subprocess.run")
+    def test_get_volume_remembers_working_control(self, mock_run, mock_amixer_get_volume_output):
+        """Test get_volume tries the last working control first."""
+        mock_run.side_effect = [
+            subprocess.CalledProcessError(1, "amixer"),  # Master fails
+            Mock(returncode=0, stdout=mock_amixer_get_volume_output, stderr=""),  # PCM succeeds
+            Mock(returncode=0, stdout=mock_amixer_get_volume_output, stderr=""),  # PCM again
+        ]
+
+        manager = AudioManager(windows_mode=False)
+        manager.get_volume("hw:0,0")
+        volume = manager.get_volume("hw:0,0")
+
+        assert volume == 75
+        assert mock_run.call_count == 3
+        assert "PCM" in mock_run.call_args[0][0]
+
     @patch("subprocess.run")
     def test_get_volume_all_controls_fail(self, mock_run):
         """Test get_volume returns default when all controls fail."""
@@ -381,7 +522,7 @@ class TestAudioManagerSetVolume:
     @patch("subprocess.run")
     def test_set_volume_hardware_device(self, mock_run):
         """Test set_volume sets volume on hardware device."""
-        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        mock_run.return_value = Mock(returncode=0, stderr=b"")
 
         manager = AudioManager(windows_mode=False)
         success, message = manager.set_volume("hw:0,0", 75)
@@ -392,16 +533,26 @@ class TestAudioManagerSetVolume:
 
         # Check command arguments
         args = mock_run.call_args[0][0]
-        assert "amixer" in args
+        assert os.path.basename(args[0]) == "amixer"
         assert "75%" in args
 
+    @patch("subprocess.run")
+    def test_set_volume_uses_spawn_friendly_options(self, mock_run):
+        """Test amixer runs with close_fds disabled so posix_spawn can be used."""
+        mock_run.return_value = Mock(returncode=0, stderr=b"")
+
+        manager = AudioManager(windows_mode=False)
+        manager.set_volume("hw:0,0", 75)
+
+        assert mock_run.call_args[1]["close_fds"] is False
+
     @patch("subprocess.run")
     def test_set_volume_tries_multiple_controls(self, mock_run):
         """Test set_volume tries multiple control names."""
         # First call fails, second succeeds
         mock_run.side_effect = [
-            subprocess.CalledProcessError(1, "amixer"),  # Master fails
-            Mock(returncode=0, stdout="", stderr=""),  # PCM succeeds
+            Mock(returncode=1, stderr=b"Unable to find simple control"),  # Master fails
+            Mock(returncode=0, stderr=b""),  # PCM succeeds
         ]
 
         manager = AudioManager(windows_mode=False)
@@ -410,10 +561,28 @@ class TestAudioManagerSetVolume:
         assert success is True
         assert mock_run.call_count == 2
 
+    @patch("subprocess.run")
+    def test_set_volume_remembers_working_control(self, mock_run):
+        """Test set_volume tries the last working control first."""
+        mock_run.side_effect = [
+            Mock(returncode=1, stderr=b"Unable to find simple control"),  # Master fails
+            Mock(returncode=0, stderr=b""),  # PCM succeeds
+            Mock(returncode=0, stderr=b""),  # PCM again
+        ]
+
+        manager = AudioManager(windows_mode=False)
+        manager.set_volume("hw:0,0", 75)
+        success, message = manager.set_volume("hw:0,0", 50)
+
+        assert success is True
+        assert "PCM" in message
+        assert mock_run.call_count == 3
+        assert "PCM" in mock_run.call_args[0][0]
+
     @patch("subprocess.run")
     def test_set_volume_all_controls_fail(self, mock_run):
         """Test set_volume returns failure when all controls fail."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "amixer")
+        mock_run.return_value = Mock(returncode=1, stderr=b"Unable to find simple control")
 
         manager = AudioManager(windows_mode=False)
         success, message = manager.set_volume("hw:0,0", 75)
@@ -434,6 +603,29 @@ class TestAudioManagerSetVolume:
         # Should not call subprocess
         mock_run.assert_not_called()
 
+    @patch("subprocess.run")
+    def test_set_volume_plughw_device(self, mock_run):
+        """Test set_volume extracts the card number from plughw devices."""
+        mock_run.return_value = Mock(returncode=0, stderr=b"")
+
+        manager = AudioManager(windows_mode=False)
+        success, _ = manager.set_volume("plughw:2,0", 50)
+
+        assert success is True
+        args = mock_run.call_args[0][0]
+        assert os.path.basename(args[0]) == "amixer"
+        assert args[1:3] == ["-c", "2"]
+
+    @patch("subprocess.run")
+    def test_set_volume_non_numeric_card(self, mock_run):
+        """Test set_volume treats named-card hw devices as having no hardware control."""
+        manager = AudioManager(windows_mode=False)
+        success, message = manager.set_volume("hw:CARD=PCH,DEV=0", 50)
+
+        assert success is True
+        assert "no hardware control" in message.lower()
+        mock_run.assert_not_called()
+
     @patch("subprocess.run")
     def test_set_volume_amixer_not_found(self, mock_run):
         """Test set_volume handles missing amixer."""
@@ -447,28 +639,119 @@ class TestAudioManagerSetVolume:
 
     @patch("subprocess.run")
     def test_set_volume_error_message_bytes(self, mock_run):
-        """Test set_volume handles bytes stderr."""
-        error = subprocess.CalledProcessError(1, "amixer")
-        error.stderr = b"Error message in bytes"
-        mock_run.side_effect = error
+        """Test set_volume handles undecodable bytes stderr."""
+        mock_run.return_value = Mock(returncode=1, stderr=b"Error message \xff in bytes")
 
         manager = AudioManager(windows_mode=False)
         success, message = manager.set_volume("hw:0,0", 75)
 
         assert success is False
-        # Should decode bytes error message
 
     @patch("subprocess.run")
-    def test_set_volume_error_message_string(self, mock_run):
-        """Test set_volume handles string stderr."""
-        error = subprocess.CalledProcessError(1, "amixer")
-        error.stderr = "Error message as string"
-        mock_run.side_effect = error
+    def test_set_volume_discards_stdout(self, mock_run):
+        """Test amixer stdout is discarded and stderr kept undecoded."""
+        mock_run.return_value = Mock(returncode=0, stderr=b"")
 
         manager = AudioManager(windows_mode=False)
-        success, message = manager.set_volume("hw:0,0", 75)
+        manager.set_volume("hw:0,0", 75)
 
-        assert success is False
+        kwargs = mock_run.call_args[1]
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        assert kwargs["stderr"] == subprocess.PIPE
+        assert "text" not in kwargs
+
+
+class TestAudioManagerAlsaaudio:
+    """Tests for volume control through the pyalsaaudio bindings."""
+
+    @pytest.fixture
+    def mock_alsaaudio(self):
+        """Provide a fake alsaaudio module and enable the in-process path."""
+        fake = Mock()
+        fake.ALSAAudioError = type("ALSAAudioError", (Exception,), {})
+        with (
+            patch("managers.audio_manager.ALSAAUDIO_AVAILABLE", True),
+            patch("managers.audio_manager.alsaaudio", fake, create=True),
+        ):
+            yield fake
+
+    @patch("subprocess.run")
+    def test_get_volume_uses_mixer(self, mock_run, mock_alsaaudio):
+        """Test get_volume reads from the mixer without spawning amixer."""
+        mock_alsaaudio.Mixer.return_value.getvolume.return_value = [42, 42]
+
+        manager = AudioManager(windows_mode=False)
+        volume = manager.get_volume("hw:1,0")
+
+        assert volume == 42
+        mock_alsaaudio.Mixer.assert_called_once_with("Master", cardindex=1)
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_set_volume_uses_mixer(self, mock_run, mock_alsaaudio):
+        """Test set_volume writes through the mixer without spawning amixer."""
+        manager = AudioManager(windows_mode=False)
+        success, message = manager.set_volume("hw:0,0", 60)
+
+        assert success is True
+        assert "Master" in message
+        mock_alsaaudio.Mixer.return_value.setvolume.assert_called_once_with(60)
+        mock_run.assert_not_called()
+
+    def test_set_volume_skips_missing_controls(self, mock_alsaaudio):
+        """Test set_volume moves on when a control does not exist."""
+        mock_alsaaudio.Mixer.side_effect = [mock_alsaaudio.ALSAAudioError("no Master"), Mock()]
+
+        manager = AudioManager(windows_mode=False)
+        success, message = manager.set_volume("hw:0,0", 60)
+
+        assert success is True
+        assert "PCM" in message
+
+    def test_mixers_are_cached(self, mock_alsaaudio):
+        """Test Mixer objects are reused across volume changes."""
+        manager = AudioManager(windows_mode=False)
+        manager.set_volume("hw:0,0", 10)
+        manager.set_volume("hw:0,0", 20)
+
+        assert mock_alsaaudio.Mixer.call_count == 1
+
+    def test_mixer_evicted_after_write_error(self, mock_alsaaudio):
+        """Test a mixer that fails on write is reopened on the next call."""
+        stale = Mock()
+        stale.setvolume.side_effect = mock_alsaaudio.ALSAAudioError("card gone")
+        fresh = Mock()
+        mock_alsaaudio.Mixer.side_effect = [stale, fresh]
+
+        manager = AudioManager(windows_mode=False)
+        manager._write_control_volume("0", "Master", 10)
+        assert manager._write_control_volume("0", "Master", 20) is True
+
+        fresh.setvolume.assert_called_once_with(20)
+
+    def test_mixer_evicted_after_read_error(self, mock_alsaaudio):
+        """Test a mixer that fails on read is reopened on the next call."""
+        stale = Mock()
+        stale.getvolume.side_effect = mock_alsaaudio.ALSAAudioError("card gone")
+        fresh = Mock()
+        fresh.getvolume.return_value = [55]
+        mock_alsaaudio.Mixer.side_effect = [stale, fresh]
+
+        manager = AudioManager(windows_mode=False)
+        assert manager._read_control_volume("0", "Master") is None
+        assert manager._read_control_volume("0", "Master") == 55
+
+    def test_read_sees_external_changes(self, mock_alsaaudio):
+        """Test cached mixers process pending events before reading."""
+        mixer = mock_alsaaudio.Mixer.return_value
+        mixer.getvolume.side_effect = [[40], [70]]
+
+        manager = AudioManager(windows_mode=False)
+        manager._read_control_volume("0", "Master")
+        volume = manager._read_control_volume("0", "Master")
+
+        assert volume == 70
+        assert [name for name, _, _ in mixer.method_calls[-2:]] == ["handleevents", "getvolume"]
 
 
 # =============================================================================
@@ -5,6 +5,7 @@ Tests configuration loading, saving, validation, and player
 management operations with mocked file I/O.
 """
 
+import os
 from unittest.mock import patch
 
 import pytest
@@ -127,6 +128,57 @@ class TestConfigManagerLoad:
         assert "Valid" in manager.players
         assert "Invalid" in manager.players
 
+    def test_load_json_file(self, tmp_path):
+        """Test a JSON players file is loaded via the JSON fast path."""
+        config_file = tmp_path / "players.yaml"
+        config_file.write_text('{"Office": {"name": "Office", "device": "hw:0,0", "provider": "squeezelite"}}')
+
+        with patch("yaml.load") as mock_load:
+            manager = ConfigManager(str(config_file), validate_on_load=False)
+
+        mock_load.assert_not_called()
+        assert manager.players["Office"]["device"] == "hw:0,0"
+
+    def test_load_yaml_flow_mapping_falls_back(self, tmp_path):
+        """Test a YAML flow mapping that is not valid JSON still loads."""
+        config_file = tmp_path / "players.yaml"
+        config_file.write_text("{Office: {name: Office, provider: squeezelite}}")
+
+        manager = ConfigManager(str(config_file), validate_on_load=False)
+
+        assert manager.players["Office"]["provider"] == "squeezelite"
+
+    def test_load_unchanged_file_skips_parse(self, mock_yaml_file):
+        """Test reloading an unchanged file reuses the parsed players."""
+        manager = ConfigManager(mock_yaml_file)
+
+        with patch("yaml.load") as mock_load:
+            players = manager.load()
+
+        mock_load.assert_not_called()
+        assert len(players) == 2
+
+    def test_load_unchanged_file_discards_unsaved_changes(self, mock_yaml_file):
+        """Test reloading from the cache still restores the file contents."""
+        manager = ConfigManager(mock_yaml_file)
+        manager.players["Kitchen"]["volume"] = 10
+        manager.delete_player("Bedroom")
+
+        players = manager.load()
+
+        assert players["Kitchen"]["volume"] == 75
+        assert "Bedroom" in players
+
+    def test_load_changed_file_reparses(self, mock_yaml_file):
+        """Test reloading after the file changes picks up the new contents."""
+        manager = ConfigManager(mock_yaml_file, validate_on_load=False)
+        with open(mock_yaml_file, "w") as f:
+            yaml.dump({"Office": {"name": "Office", "provider": "squeezelite"}}, f)
+
+        players = manager.load()
+
+        assert list(players) == ["Office"]
+
 
 # =============================================================================
 # TESTS - Save
@@ -195,6 +247,29 @@ class TestConfigManagerSave:
 
         assert result is True
 
+    def test_save_revalidates_only_changed_players(self, mock_yaml_file):
+        """Test save skips validation for players unchanged since last validated."""
+        manager = ConfigManager(mock_yaml_file)
+        manager.players["Kitchen"]["volume"] = 30
+
+        with patch(
+            "managers.config_manager.validate_players_file",
+            return_value=(True, [], {}),
+        ) as mock_validate:
+            manager.save()
+
+        mock_validate.assert_called_once()
+        assert list(mock_validate.call_args[0][0]) == ["Kitchen"]
+
+    def test_save_rejects_player_mutated_in_place(self, mock_yaml_file):
+        """Test in-place edits to a validated player are still validated."""
+        manager = ConfigManager(mock_yaml_file)
+        manager.save()
+        manager.get_player("Kitchen")["volume"] = 150
+
+        with pytest.raises(ConfigValidationError):
+            manager.save()
+
     def test_save_returns_false_on_error(self, tmp_path):
         """Test save returns False on file I/O error."""
         config_path = tmp_path / "players.yaml"
@@ -205,6 +280,57 @@ class TestConfigManagerSave:
             result = manager.save()
             assert result is False
 
+    def test_save_replaces_file_atomically(self, tmp_path, sample_squeezelite_config):
+        """Test save writes through a temporary file renamed over the config."""
+        config_path = tmp_path / "players.yaml"
+        manager = ConfigManager(str(config_path), validate_on_save=False)
+        manager.players["Kitchen"] = sample_squeezelite_config
+
+        with patch("os.replace", wraps=os.replace) as mock_replace:
+            manager.save()
+
+        mock_replace.assert_called_once_with(f"{config_path}.tmp", str(config_path))
+        assert not (tmp_path / "players.yaml.tmp").exists()
+
+    def test_save_failure_keeps_existing_file(self, mock_yaml_file):
+        """Test a failed write leaves the previous config intact."""
+        manager = ConfigManager(mock_yaml_file, validate_on_save=False)
+        manager.players["Office"] = {"name": "Office", "provider": "squeezelite"}
+
+        with patch("os.replace", side_effect=OSError("Disk full")):
+            result = manager.save()
+
+        assert result is False
+        with open(mock_yaml_file) as f:
+            assert "Office" not in yaml.safe_load(f)
+        assert not os.path.exists(f"{mock_yaml_file}.tmp")
+
+    def test_save_unchanged_skips_write(self, tmp_path, sample_squeezelite_config):
+        """Test saving identical contents twice only writes the file once."""
+        config_path = tmp_path / "players.yaml"
+        manager = ConfigManager(str(config_path), validate_on_save=False)
+        manager.players["Kitchen"] = sample_squeezelite_config
+        manager.save()
+
+        with patch("builtins.open") as mock_open:
+            result = manager.save()
+
+        assert result is True
+        mock_open.assert_not_called()
+
+    def test_save_rewrites_after_external_change(self, tmp_path, sample_squeezelite_config):
+        """Test save rewrites the file if it was modified since the last save."""
+        config_path = tmp_path / "players.yaml"
+        manager = ConfigManager(str(config_path), validate_on_save=False)
+        manager.players["Kitchen"] = sample_squeezelite_config
+        manager.save()
+        config_path.write_text("{}\n")
+
+        manager.save()
+
+        with open(config_path) as f:
+            assert "Kitchen" in yaml.safe_load(f)
+
 
 # =============================================================================
 # TESTS - Player Operations
@@ -292,6 +418,72 @@ class TestConfigManagerSetPlayer:
         assert config_path.exists()
 
 
+class TestConfigManagerSetPlayers:
+    """Tests for ConfigManager.set_players() and batch()."""
+
+    def test_set_players_adds_all(self, tmp_path, sample_squeezelite_config, sample_sendspin_config):
+        """Test set_players stores every valid config."""
+        manager = ConfigManager(str(tmp_path / "players.yaml"))
+        manager.set_players({"Kitchen": sample_squeezelite_config, "Bedroom": sample_sendspin_config})
+
+        assert manager.list_players() == ["Kitchen", "Bedroom"]
+
+    def test_set_players_invalid_sets_none(self, tmp_path, sample_squeezelite_config):
+        """Test set_players stores nothing if any config is invalid."""
+        manager = ConfigManager(str(tmp_path / "players.yaml"))
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            manager.set_players(
+                {
+                    "Kitchen": sample_squeezelite_config,
+                    "Invalid": {"name": "Invalid", "volume": 150},
+                }
+            )
+
+        assert len(exc_info.value.errors) == 1
+        assert manager.players == {}
+
+    def test_batch_validates_once_and_saves_once(self, tmp_path, sample_squeezelite_config, sample_sendspin_config):
+        """Test batch defers validation to a single pass and saves at the end."""
+        config_path = tmp_path / "players.yaml"
+        manager = ConfigManager(str(config_path))
+
+        with (
+            patch("managers.config_manager.validate_player_config") as mock_validate_one,
+            patch.object(manager, "save", wraps=manager.save) as mock_save,
+        ):
+            with manager.batch():
+                manager.set_player("Kitchen", sample_squeezelite_config)
+                manager.set_player("Bedroom", sample_sendspin_config)
+                assert not config_path.exists()
+
+            mock_validate_one.assert_not_called()
+            mock_save.assert_called_once()
+
+        with open(config_path) as f:
+            assert set(yaml.safe_load(f)) == {"Kitchen", "Bedroom"}
+
+    def test_batch_invalid_raises_without_saving(self, tmp_path):
+        """Test batch raises at exit for invalid players and does not save."""
+        config_path = tmp_path / "players.yaml"
+        manager = ConfigManager(str(config_path))
+
+        with pytest.raises(ConfigValidationError), manager.batch():
+            manager.set_player("Invalid", {"name": "Invalid", "volume": 150})
+
+        assert not config_path.exists()
+
+    def test_batch_save_failure_raises(self, tmp_path, sample_squeezelite_config):
+        """Test batch raises at exit when the final save fails."""
+        manager = ConfigManager(str(tmp_path / "players.yaml"))
+
+        with patch.object(manager, "save", return_value=False) as mock_save:
+            with pytest.raises(OSError), manager.batch():
+                manager.set_player("Kitchen", sample_squeezelite_config)
+
+            mock_save.assert_called_once()
+
+
 class TestConfigManagerDeletePlayer:
     """Tests for ConfigManager.delete_player() method."""
 
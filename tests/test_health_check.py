@@ -0,0 +1,151 @@
+"""
+Tests for the container health check runner.
+
+Tests cover ordering of concurrently run checks, capture of crash
+tracebacks, and skipping checks whose prerequisite failed.
+"""
+
+import sys
+import threading
+from unittest.mock import patch
+
+import health_check
+import pytest
+
+# The real Flask check, kept before the fixtures replace it (a name not
+# starting with "test_" so pytest does not collect it)
+REAL_FLASK_CHECK = health_check.test_flask_app
+
+CHECK_NAMES = ("test_imports", "test_directories", "test_flask_app", "test_audio_commands", "test_port_availability")
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def make_check(label, result=True):
+    """Create a fake check that prints its label and returns result."""
+
+    def check():
+        print(f"{label} output")
+        return result
+
+    return check
+
+
+@pytest.fixture
+def checks():
+    """Replace every health check with a passing fake that prints its name."""
+    fakes = {name: make_check(name) for name in CHECK_NAMES}
+    with patch.multiple(health_check, **fakes):
+        yield fakes
+
+
+def run_main(capsys):
+    """Run health_check.main() and return (exit code, stdout, stderr)."""
+    with pytest.raises(SystemExit) as exc_info:
+        health_check.main()
+    captured = capsys.readouterr()
+    return exc_info.value.code, captured.out, captured.err
+
+
+# =============================================================================
+# TEST REPORT ORDER
+# =============================================================================
+
+
+class TestReportOrder:
+    """Tests for the order of check output in the report."""
+
+    def test_blocks_in_declared_order_when_finishing_out_of_order(self, checks, capsys):
+        """Test a check that finishes last is still reported first."""
+        last_check_done = threading.Event()
+
+        def slow_imports():
+            last_check_done.wait(timeout=5)
+            print("test_imports output")
+            return True
+
+        def fast_port_check():
+            print("test_port_availability output")
+            last_check_done.set()
+            return True
+
+        with patch.multiple(health_check, test_imports=slow_imports, test_port_availability=fast_port_check):
+            code, out, _ = run_main(capsys)
+
+        assert code == 0
+        positions = [out.index(f"{name} output") for name in CHECK_NAMES]
+        assert positions == sorted(positions)
+        assert "5/5 tests passed" in out
+
+
+# =============================================================================
+# TEST CRASH OUTPUT
+# =============================================================================
+
+
+class TestCrashOutput:
+    """Tests for traceback capture of crashing checks."""
+
+    def test_crash_traceback_in_own_block(self, checks, capsys):
+        """Test a crashing check's traceback appears between its neighbours."""
+
+        def crashing_check():
+            raise RuntimeError("directory probe exploded")
+
+        with patch.object(health_check, "test_directories", crashing_check):
+            code, out, err = run_main(capsys)
+
+        assert code == 1
+        traceback_pos = out.index("RuntimeError: directory probe exploded")
+        assert out.index("test_imports output") < traceback_pos < out.index("test_flask_app output")
+        assert "Directory Access test crashed" in out
+        assert err == ""
+
+    def test_flask_app_traceback_in_own_block(self, checks, capsys):
+        """Test the Flask check's own traceback goes to its block, not stderr."""
+        with (
+            patch.object(health_check, "test_flask_app", REAL_FLASK_CHECK),
+            patch("flask.Flask", side_effect=RuntimeError("flask exploded")),
+        ):
+            code, out, err = run_main(capsys)
+
+        assert code == 1
+        traceback_pos = out.index("RuntimeError: flask exploded")
+        assert out.index("test_directories output") < traceback_pos < out.index("test_audio_commands output")
+        assert err == ""
+
+    def test_stderr_output_in_own_block(self, checks, capsys):
+        """Test stderr writes from a check are folded into its report block."""
+
+        def noisy_check():
+            print("audio warning on stderr", file=sys.stderr)
+            return True
+
+        with patch.object(health_check, "test_audio_commands", noisy_check):
+            code, out, err = run_main(capsys)
+
+        assert code == 0
+        stderr_pos = out.index("audio warning on stderr")
+        assert out.index("test_flask_app output") < stderr_pos < out.index("test_port_availability output")
+        assert err == ""
+
+
+# =============================================================================
+# TEST PREREQUISITES
+# =============================================================================
+
+
+class TestPrerequisites:
+    """Tests for skipping checks whose prerequisite failed."""
+
+    def test_flask_app_skipped_when_imports_fail(self, checks, capsys):
+        """Test Flask App is skipped, not run, after Python Imports fails."""
+        with patch.object(health_check, "test_imports", make_check("test_imports", result=False)):
+            code, out, _ = run_main(capsys)
+
+        assert code == 1
+        assert "Flask App test skipped (Python Imports failed)" in out
+        assert "test_flask_app output" not in out
+        assert "3/5 tests passed" in out
@@ -0,0 +1,102 @@
+"""
+Tests for the provider registry.
+
+Tests cover caching of provider availability checks and the combined
+provider snapshot.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from providers.registry import PROVIDER_AVAILABILITY_TTL_SECS, ProviderRegistry
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def make_provider(available=True):
+    """Create a mock provider with the given availability."""
+    provider = Mock()
+    provider.display_name = "Mock"
+    provider.binary_name = "mock"
+    provider.is_available.return_value = available
+    return provider
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with an available squeezelite and unavailable sendspin."""
+    registry = ProviderRegistry()
+    registry.register_instance("squeezelite", make_provider(available=True))
+    registry.register_instance("sendspin", make_provider(available=False))
+    return registry
+
+
+# =============================================================================
+# TEST AVAILABILITY CACHING
+# =============================================================================
+
+
+class TestAvailabilityCache:
+    """Tests for caching of provider is_available() results."""
+
+    def test_availability_checked_once_within_ttl(self, registry):
+        """Test repeated listings reuse the cached availability."""
+        registry.list_providers(available_only=True)
+        registry.get_provider_info()
+        registry.get_default_available_provider()
+
+        assert registry.get("squeezelite").is_available.call_count == 1
+        assert registry.get("sendspin").is_available.call_count == 1
+
+    def test_availability_rechecked_after_ttl(self, registry):
+        """Test availability is checked again once the TTL expires."""
+        with patch("providers.registry.time.monotonic", return_value=1000.0):
+            registry.list_providers(available_only=True)
+        with patch("providers.registry.time.monotonic", return_value=1000.0 + PROVIDER_AVAILABILITY_TTL_SECS):
+            registry.list_providers(available_only=True)
+
+        assert registry.get("squeezelite").is_available.call_count == 2
+
+    def test_register_instance_invalidates_availability(self, registry):
+        """Test re-registering a provider discards its cached availability."""
+        assert registry.list_providers(available_only=True) == ["squeezelite"]
+
+        registry.register_instance("sendspin", make_provider(available=True))
+
+        assert registry.list_providers(available_only=True) == ["squeezelite", "sendspin"]
+
+
+# =============================================================================
+# TEST SNAPSHOT
+# =============================================================================
+
+
+class TestSnapshot:
+    """Tests for the single-pass provider snapshot."""
+
+    def test_snapshot_returns_all_views(self, registry):
+        """Test snapshot returns info, available types, and default together."""
+        info, available, default = registry.snapshot()
+
+        assert [entry["type"] for entry in info] == ["squeezelite"]
+        assert available == ["squeezelite"]
+        assert default == "squeezelite"
+
+    def test_snapshot_includes_unavailable_info(self, registry):
+        """Test available_only=False keeps unavailable providers in the info list."""
+        info, available, _ = registry.snapshot(available_only=False)
+
+        assert [(entry["type"], entry["available"]) for entry in info] == [
+            ("squeezelite", True),
+            ("sendspin", False),
+        ]
+        assert available == ["squeezelite"]
+
+    def test_snapshot_falls_back_to_first_available(self, registry):
+        """Test the default falls back when the configured default is unavailable."""
+        registry.default_provider = "sendspin"
+
+        assert registry.snapshot()[2] == "squeezelite"
+        assert registry.get_default_available_provider() == "squeezelite"
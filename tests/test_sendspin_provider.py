@@ -5,13 +5,14 @@ Tests cover command building, configuration validation, client ID generation,
 and volume control delegation.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from providers.sendspin import (
     CLIENT_ID_PREFIX,
     DEFAULT_LOG_LEVEL,
     SendspinProvider,
+    _client_id_for_name,
 )
 
 # =============================================================================
@@ -183,6 +184,13 @@ class TestBuildCommand:
         client_id = cmd[id_idx + 1]
         assert client_id.startswith(CLIENT_ID_PREFIX)
 
+    def test_build_command_existing_client_id_not_regenerated(self, sendspin_provider, sample_sendspin_config):
+        """Test that no client ID is generated when the config already has one."""
+        with patch.object(sendspin_provider, "_generate_client_id") as mock_generate:
+            sendspin_provider.build_command(sample_sendspin_config, "/app/logs/test.log")
+
+        mock_generate.assert_not_called()
+
     def test_build_command_always_headless(self, sendspin_provider, sample_sendspin_config):
         """Test that --headless is always included."""
         cmd = sendspin_provider.build_command(sample_sendspin_config, "/app/logs/test.log")
@@ -335,6 +343,13 @@ class TestGetDefaultConfig:
         assert defaults["volume"] == 75
         assert defaults["autostart"] is False
 
+    def test_default_config_returns_independent_copy(self, sendspin_provider):
+        """Test that modifying returned defaults doesn't affect later calls."""
+        defaults = sendspin_provider.get_default_config()
+        defaults["device"] = "1"
+
+        assert sendspin_provider.get_default_config()["device"] == "default"
+
 
 # =============================================================================
 # TEST GET_REQUIRED_FIELDS
@@ -405,6 +420,14 @@ class TestGenerateClientId:
         # Last part should be 8-char hex hash
         assert len(parts[-1]) == 8
 
+    def test_generate_client_id_is_cached(self, sendspin_provider):
+        """Test that repeated IDs for the same name are served from cache."""
+        sendspin_provider._generate_client_id("Cached Player")
+        hits = _client_id_for_name.cache_info().hits
+        sendspin_provider._generate_client_id("Cached Player")
+
+        assert _client_id_for_name.cache_info().hits == hits + 1
+
 
 # =============================================================================
 # TEST PREPARE_CONFIG
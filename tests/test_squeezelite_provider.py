@@ -15,6 +15,7 @@ from providers.squeezelite import (
     DEFAULT_SAMPLE_RATE,
     NULL_DEVICE,
     SqueezeliteProvider,
+    _mac_address_for_name,
 )
 
 # =============================================================================
@@ -340,6 +341,13 @@ class TestGetDefaultConfig:
         assert defaults["volume"] == 75
         assert defaults["autostart"] is False
 
+    def test_default_config_returns_independent_copy(self, squeezelite_provider):
+        """Test that modifying returned defaults doesn't affect later calls."""
+        defaults = squeezelite_provider.get_default_config()
+        defaults["device"] = "hw:1,0"
+
+        assert squeezelite_provider.get_default_config()["device"] == "default"
+
 
 # =============================================================================
 # TEST GET_REQUIRED_FIELDS
@@ -391,6 +399,14 @@ class TestGenerateMacAddress:
 
         assert mac1 != mac2
 
+    def test_generate_mac_address_is_cached(self):
+        """Test that repeated MACs for the same name are served from cache."""
+        SqueezeliteProvider.generate_mac_address("Cached Player")
+        hits = _mac_address_for_name.cache_info().hits
+        SqueezeliteProvider.generate_mac_address("Cached Player")
+
+        assert _mac_address_for_name.cache_info().hits == hits + 1
+
     def test_generate_mac_address_locally_administered_bit(self):
         """Test that locally-administered bit (0x02) is set."""
         mac = SqueezeliteProvider.generate_mac_address("Test")